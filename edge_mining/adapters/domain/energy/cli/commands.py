@@ -876,6 +876,8 @@ def handle_energy_monitor_home_assistant_configuration(
     default_unit_battery_remaining_capacity = "Wh"
     default_grid_positive_export = False
     default_battery_positive_charge = True
+    default_refresh_interval_seconds = 0
+    default_max_data_age_seconds = 120
     if energy_monitor:
         if isinstance(energy_monitor.config, EnergyMonitorHomeAssistantConfig):
             default_entity_production = energy_monitor.config.entity_production
@@ -891,6 +893,8 @@ def handle_energy_monitor_home_assistant_configuration(
             default_unit_battery_remaining_capacity = energy_monitor.config.unit_battery_remaining_capacity
             default_grid_positive_export = energy_monitor.config.grid_positive_export
             default_battery_positive_charge = energy_monitor.config.battery_positive_charge
+            default_refresh_interval_seconds = energy_monitor.config.refresh_interval_seconds
+            default_max_data_age_seconds = energy_monitor.config.max_data_age_seconds
 
     entity_production: str = click.prompt(
         "Entity ID for production (e.g. sensor.solar_production)",
@@ -971,6 +975,19 @@ def handle_energy_monitor_home_assistant_configuration(
         default=default_battery_positive_charge,
     )
 
+    refresh_interval_seconds: int = click.prompt(
+        "Background refresh interval in seconds (0 to fetch on demand)",
+        type=int,
+        default=default_refresh_interval_seconds,
+    )
+    max_data_age_seconds: int = default_max_data_age_seconds
+    if refresh_interval_seconds > 0:
+        max_data_age_seconds = click.prompt(
+            "Maximum age in seconds of the background refreshed energy state",
+            type=int,
+            default=default_max_data_age_seconds,
+        )
+
     return EnergyMonitorHomeAssistantConfig(
         entity_production=entity_production,
         entity_consumption=entity_consumption,
@@ -985,6 +1002,8 @@ def handle_energy_monitor_home_assistant_configuration(
         unit_battery_remaining_capacity=unit_battery_remaining_capacity,
         grid_positive_export=grid_positive_export,
         battery_positive_charge=battery_positive_charge,
+        refresh_interval_seconds=refresh_interval_seconds,
+        max_data_age_seconds=max_data_age_seconds,
     )
 
 
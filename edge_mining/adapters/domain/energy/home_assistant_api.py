@@ -3,13 +3,14 @@ Home Assistant API adapter (Implementation of Port)
 for the energy provisioning of Edge Mining Application using the Home Assistant API
 """
 
-from datetime import datetime
-from typing import Optional, cast
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple, cast
 
 from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import (
     ServiceHomeAssistantAPI,
 )
-from edge_mining.domain.common import Timestamp, Watts
+from edge_mining.domain.common import Timestamp, WattHours, Watts
 from edge_mining.domain.energy.common import EnergyMonitorAdapter
 from edge_mining.domain.energy.entities import EnergySource
 from edge_mining.domain.energy.exceptions import (
@@ -30,6 +31,10 @@ from edge_mining.shared.interfaces.config import Configuration
 from edge_mining.shared.interfaces.factories import EnergyMonitorAdapterFactory
 from edge_mining.shared.logging.port import LoggerPort
 
+# Polls between two checks of the entities missing from Home Assistant,
+# which may show up later (Home Assistant starting, integration reloading)
+UNKNOWN_ENTITIES_RECHECK_POLLS = 10
+
 
 class HomeAssistantAPIEnergyMonitorFactory(EnergyMonitorAdapterFactory):
     """
@@ -132,6 +137,13 @@ class HomeAssistantAPIEnergyMonitorFactory(EnergyMonitorAdapterFactory):
                     entity_id=energy_monitor_config.entity_battery_remaining_capacity
                 )
 
+        # --- Background Refresh ---
+        if energy_monitor_config.refresh_interval_seconds > 0:
+            builder.set_background_refresh(
+                interval_seconds=energy_monitor_config.refresh_interval_seconds,
+                max_data_age_seconds=energy_monitor_config.max_data_age_seconds,
+            )
+
         # --- Build the adapter ---
         return builder.build()
 
@@ -155,6 +167,8 @@ class HomeAssistantAPIEnergyMonitorBuilder:
         self.unit_battery_remaining_capacity: str = "Wh"
         self.grid_positive_export: bool = False
         self.battery_positive_charge: bool = True
+        self.refresh_interval_seconds: int = 0
+        self.max_data_age_seconds: int = 120
 
     def set_production_entity(self, entity_id: str, unit: str = "W") -> "HomeAssistantAPIEnergyMonitorBuilder":
         """Set entity for monitoring the production"""
@@ -201,6 +215,14 @@ class HomeAssistantAPIEnergyMonitorBuilder:
         self.unit_battery_remaining_capacity = unit.lower()
         return self
 
+    def set_background_refresh(
+        self, interval_seconds: int, max_data_age_seconds: int = 120
+    ) -> "HomeAssistantAPIEnergyMonitorBuilder":
+        """Set the interval of the background refresh and the maximum age of the refreshed state"""
+        self.refresh_interval_seconds = interval_seconds
+        self.max_data_age_seconds = max_data_age_seconds
+        return self
+
     def build(self) -> "HomeAssistantAPIEnergyMonitor":
         """Build and validate the HomeAssistantAPIEnergyMonitor instance."""
 
@@ -210,6 +232,12 @@ class HomeAssistantAPIEnergyMonitorBuilder:
         if self.entity_battery_soc and not self.entity_battery_power:
             raise EnergyMonitorError("Battery power entity is required when battery SOC is configured")
 
+        if self.refresh_interval_seconds < 0:
+            raise EnergyMonitorError("Background refresh interval must not be negative")
+
+        if self.refresh_interval_seconds and self.max_data_age_seconds <= 0:
+            raise EnergyMonitorError("Maximum data age must be positive when background refresh is enabled")
+
         monitor = HomeAssistantAPIEnergyMonitor(
             home_assistant=self.home_assistant,
             logger=self.logger,
@@ -226,6 +254,8 @@ class HomeAssistantAPIEnergyMonitorBuilder:
             unit_battery_remaining_capacity=self.unit_battery_remaining_capacity,
             grid_positive_export=self.grid_positive_export,
             battery_positive_charge=self.battery_positive_charge,
+            refresh_interval_seconds=self.refresh_interval_seconds,
+            max_data_age_seconds=self.max_data_age_seconds,
         )
 
         return monitor
@@ -238,6 +268,10 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
     Requires careful configuration of entity IDs.
     Make sure the House Consumption entity EXCLUDES the consumption of miners,
     possibly using a template sensor in Home Assistant.
+
+    When a refresh interval is configured, the energy state is fetched by a
+    background thread and get_current_energy_state returns the latest snapshot
+    without waiting on Home Assistant.
     """
 
     def __init__(
@@ -257,6 +291,8 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
         unit_battery_remaining_capacity: str = "Wh",
         grid_positive_export: bool = False,
         battery_positive_charge: bool = True,
+        refresh_interval_seconds: int = 0,
+        max_data_age_seconds: int = 120,
     ):
         super().__init__(energy_monitor_type=EnergyMonitorAdapter.HOME_ASSISTANT_API)
 
@@ -278,8 +314,134 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
         self.grid_positive_export = grid_positive_export
         self.battery_positive_charge = battery_positive_charge
 
+        # Units and sign conventions resolved once to a multiplier per channel,
+        # unsupported units are reported here instead of on every poll.
+        grid_sign = -1.0 if self.grid_positive_export else 1.0
+        battery_sign = 1.0 if self.battery_positive_charge else -1.0
+        self._mult_production = self.home_assistant.power_unit_multiplier(
+            self.unit_production, self.entity_production or "N/A"
+        )
+        self._mult_consumption = self.home_assistant.power_unit_multiplier(
+            self.unit_consumption, self.entity_consumption or "N/A"
+        )
+        self._mult_grid = grid_sign * self.home_assistant.power_unit_multiplier(
+            self.unit_grid, self.entity_grid or "N/A"
+        )
+        self._mult_battery_power = battery_sign * self.home_assistant.power_unit_multiplier(
+            self.unit_battery_power, self.entity_battery_power or "N/A"
+        )
+        self._mult_battery_remaining_capacity = self.home_assistant.energy_unit_multiplier(
+            self.unit_battery_remaining_capacity, self.entity_battery_remaining_capacity or "N/A"
+        )
+
+        # Fetch plan, resolved once: only channels with a configured entity are polled.
+        # Battery SOC and power are only meaningful together, so both are skipped if one is missing.
+        has_battery = bool(self.entity_battery_soc and self.entity_battery_power)
+        plan: Tuple[Tuple[str, Optional[str]], ...] = (
+            ("production", self.entity_production),
+            ("consumption", self.entity_consumption),
+            ("grid", self.entity_grid),
+            ("battery_soc", self.entity_battery_soc if has_battery else None),
+            ("battery_power", self.entity_battery_power if has_battery else None),
+            ("battery_remaining_capacity", self.entity_battery_remaining_capacity),
+        )
+        self._configured_plan: Tuple[Tuple[str, str], ...] = tuple(
+            (channel, entity_id) for channel, entity_id in plan if entity_id
+        )
+        self._plan = self._configured_plan
+        # Default (missing) state for every channel, copied on each poll
+        self._default_states: Dict[str, Optional[str]] = {channel: None for channel, _ in plan}
+        # Configured entities not found in Home Assistant, checked again every few polls
+        self._unknown_entities: Tuple[Tuple[str, str], ...] = ()
+        self._polls_since_entities_check = 0
+        self._check_configured_entities()
+
+        # Background refresh of the energy state
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.max_data_age = timedelta(seconds=max_data_age_seconds)
+        # Latest snapshot fetched by the refresh thread
+        self._snapshot: Optional[EnergyStateSnapshot] = None
+        # Lock for thread-safe access to the latest snapshot
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
         self._log_configuration()
 
+    def _check_configured_entities(self) -> None:
+        """
+        Check the configured entity IDs against Home Assistant and remove the unknown ones
+        from the fetch plan, so they are not requested on every poll. Entities found again
+        are put back in the plan.
+        """
+        self._polls_since_entities_check = 0
+        known_entity_ids = self.home_assistant.get_entity_ids()
+        if known_entity_ids is None:
+            # Entities cannot be listed, keep the plan as is and rely on per poll errors
+            return
+
+        unknown_entities = tuple(
+            (channel, entity_id) for channel, entity_id in self._configured_plan if entity_id not in known_entity_ids
+        )
+        if self.logger:
+            for channel, entity_id in unknown_entities:
+                if (channel, entity_id) not in self._unknown_entities:
+                    self.logger.warning(
+                        f"Home Assistant entity '{entity_id}' configured for {channel} does not exist. "
+                        f"The entity will not be fetched until it is found."
+                    )
+            for channel, entity_id in self._unknown_entities:
+                if (channel, entity_id) not in unknown_entities:
+                    self.logger.info(
+                        f"Home Assistant entity '{entity_id}' configured for {channel} has been found. "
+                        f"The entity will be fetched again."
+                    )
+        self._unknown_entities = unknown_entities
+        self._plan = tuple(
+            (channel, entity_id) for channel, entity_id in self._configured_plan if entity_id in known_entity_ids
+        )
+
+    def start(self) -> None:
+        """
+        Start the background thread refreshing the energy state.
+        The first refresh happens after one interval, since the first read fetches the state itself.
+        """
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5.0)  # Wait for the thread to finish
+            if self._thread.is_alive():
+                if self.logger:
+                    self.logger.warning("Home Assistant energy refresh thread did not stop gracefully.")
+        self._thread = None
+
+    def _refresh_loop(self) -> None:
+        """Function run in a separate thread to keep the energy state up to date."""
+        if self.logger:
+            self.logger.info(
+                f"Home Assistant energy refresh loop started (interval: {self.refresh_interval_seconds}s)."
+            )
+        while not self._stop_event.wait(self.refresh_interval_seconds):
+            try:
+                snapshot = self._fetch_energy_state()
+                if snapshot is not None:
+                    with self._lock:
+                        self._snapshot = snapshot
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Exception in Home Assistant energy refresh loop: {e}")
+
+        if self.logger:
+            self.logger.info("Home Assistant energy refresh loop stopped.")
+
     def _log_configuration(self):
         """Log the current configuration of the monitor."""
         if self.logger:
@@ -305,85 +467,99 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
                 f"Grid Positive Export='{self.grid_positive_export}', "
                 f"Battery Positive Charge='{self.battery_positive_charge}'"
             )
+            self.logger.debug(
+                f"Background Refresh: Interval='{self.refresh_interval_seconds}s', Max Data Age='{self.max_data_age}'"
+            )
 
     def get_current_energy_state(self) -> Optional[EnergyStateSnapshot]:
+        """
+        Give the latest energy state snapshot.
+        Without background refresh the state is fetched from Home Assistant on demand,
+        otherwise the last refreshed snapshot is returned if it is not too old.
+        """
+        if not self.refresh_interval_seconds:
+            return self._fetch_energy_state()
+
+        with self._lock:
+            snapshot = self._snapshot
+
+        if snapshot is None:
+            # First read, or no refresh succeeded yet: fetch the state now
+            snapshot = self._fetch_energy_state()
+            if snapshot is not None:
+                with self._lock:
+                    self._snapshot = snapshot
+
+        # The refresh thread runs only while the monitor is in use
+        self.start()
+
+        if snapshot is None:
+            return None
+
+        age = datetime.now() - snapshot.timestamp
+        if age > self.max_data_age:
+            if self.logger:
+                self.logger.warning(
+                    f"Latest energy state from Home Assistant is stale (Age: {age}, Max age: {self.max_data_age})."
+                )
+            return None
+
+        return snapshot
+
+    def _fetch_energy_state(self) -> Optional[EnergyStateSnapshot]:
+        """Fetch the energy state from Home Assistant and build a snapshot."""
         if self.logger:
             self.logger.debug("Fetching current energy state from Home Assistant...")
         now = Timestamp(datetime.now())
         has_critical_error = False
 
-        # --- Production ---
-        if self.entity_production:
-            state_production, _ = self.home_assistant.get_entity_state(self.entity_production)
-            production_watts = self.home_assistant.parse_power(
-                state_production,
-                self.unit_production,
-                self.entity_production or "N/A",
-            )
-        else:
-            production_watts = None
+        # --- Look again for the entities missing from Home Assistant ---
+        if self._unknown_entities:
+            self._polls_since_entities_check += 1
+            if self._polls_since_entities_check >= UNKNOWN_ENTITIES_RECHECK_POLLS:
+                self._check_configured_entities()
 
-        # --- Consumption ---
-        if self.entity_consumption:
-            state_consumption, _ = self.home_assistant.get_entity_state(self.entity_consumption)
-            consumption_watts = self.home_assistant.parse_power(
-                state_consumption,
-                self.unit_consumption,
-                self.entity_consumption or "N/A",
-            )
-        else:
-            consumption_watts = None
-
-        # --- Grid ---
-        if self.entity_grid:
-            state_grid, _ = self.home_assistant.get_entity_state(self.entity_grid)
-            grid_watts_raw = self.home_assistant.parse_power(state_grid, self.unit_grid, self.entity_grid or "N/A")
-        else:
-            grid_watts_raw = None
+        # --- Fetch states of the configured entities only ---
+        states = dict(self._default_states)
+        for channel, entity_id in self._plan:
+            states[channel], _ = self.home_assistant.get_entity_state(entity_id)
 
-        # --- Battery ---
-        if self.entity_battery_soc and self.entity_battery_power:
-            state_battery_soc, _ = self.home_assistant.get_entity_state(self.entity_battery_soc)
-            state_battery_power, _ = self.home_assistant.get_entity_state(self.entity_battery_power)
-            battery_soc = self.home_assistant.parse_percentage(state_battery_soc, self.entity_battery_soc or "N/A")
-            battery_power_raw = self.home_assistant.parse_power(
-                state_battery_power,
-                self.unit_battery_power,
-                self.entity_battery_power or "N/A",
-            )
-        else:
-            battery_soc = None
-            battery_power_raw = None
-
-        if self.entity_battery_remaining_capacity:
-            state_battery_remaining_capacity, _ = self.home_assistant.get_entity_state(
-                self.entity_battery_remaining_capacity
-            )
-            battery_remaining_capacity = self.home_assistant.parse_energy(
-                state_battery_remaining_capacity,
-                self.unit_battery_remaining_capacity,
-                self.entity_battery_remaining_capacity or "N/A",
-            )
-        else:
-            battery_remaining_capacity = None
+        # --- Parse values, unconfigured channels stay None ---
+        production = self.home_assistant.parse_scaled(
+            states["production"], self._mult_production, self.entity_production or "N/A"
+        )
+        consumption = self.home_assistant.parse_scaled(
+            states["consumption"], self._mult_consumption, self.entity_consumption or "N/A"
+        )
+        grid = self.home_assistant.parse_scaled(states["grid"], self._mult_grid, self.entity_grid or "N/A")
+        battery_soc = self.home_assistant.parse_percentage(states["battery_soc"], self.entity_battery_soc or "N/A")
+        battery_power_value = self.home_assistant.parse_scaled(
+            states["battery_power"], self._mult_battery_power, self.entity_battery_power or "N/A"
+        )
+        battery_remaining_capacity_value = self.home_assistant.parse_scaled(
+            states["battery_remaining_capacity"],
+            self._mult_battery_remaining_capacity,
+            self.entity_battery_remaining_capacity or "N/A",
+        )
 
         # --- Apply Conventions ---
+        # Sign conventions are already part of the channel multipliers:
         # Grid: We want positive for IMPORTING, negative for EXPORTING
-        if grid_watts_raw is not None:
-            grid_watts = -grid_watts_raw if self.grid_positive_export else grid_watts_raw
-        else:
-            grid_watts = None
-            if self.entity_grid:
-                has_critical_error = True  # Grid is usually important
-
         # Battery: We want positive for CHARGING, negative for DISCHARGING
-        if battery_power_raw is not None:
-            battery_power = battery_power_raw if self.battery_positive_charge else -battery_power_raw
-        else:
-            battery_power = None
-            # Only critical if battery SOC is also configured
-            if self.entity_battery_soc and self.entity_battery_power:
-                has_critical_error = True
+        production_watts = Watts(production) if production is not None else None
+        consumption_watts = Watts(consumption) if consumption is not None else None
+        grid_watts = Watts(grid) if grid is not None else None
+        battery_power = Watts(battery_power_value) if battery_power_value is not None else None
+        battery_remaining_capacity = (
+            WattHours(battery_remaining_capacity_value) if battery_remaining_capacity_value is not None else None
+        )
+
+        if grid_watts is None and self.entity_grid:
+            has_critical_error = True  # Grid is usually important
+
+        # Only critical if battery SOC is also configured
+        if battery_power is None and self.entity_battery_soc and self.entity_battery_power:
+            has_critical_error = True
 
         # Check if essential values are missing
         if production_watts is None and self.entity_production:
@@ -413,7 +589,7 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
         # Create GridState if relevant entities are available
         grid_state: Optional[GridState] = None
         if grid_watts is not None:
-            grid_state = GridState(current_power=Watts(grid_watts), timestamp=reading_timestamp)
+            grid_state = GridState(current_power=grid_watts, timestamp=reading_timestamp)
 
         # Construct BatteryState if relevant entities are available
         battery_state: Optional[BatteryState] = None
@@ -421,7 +597,7 @@ class HomeAssistantAPIEnergyMonitor(EnergyMonitorPort):
             battery_state = BatteryState(
                 state_of_charge=battery_soc,
                 remaining_capacity=battery_remaining_capacity,
-                current_power=Watts(battery_power),
+                current_power=battery_power,
                 timestamp=reading_timestamp,
             )
         elif self.entity_battery_soc:  # Log if configured but data missing
@@ -561,6 +561,12 @@ class EnergyMonitorHomeAssistantConfigSchema(BaseModel):
     unit_battery_remaining_capacity: str = Field(default="Wh", description="Battery remaining capacity unit")
     grid_positive_export: bool = Field(default=False, description="Grid positive export direction")
     battery_positive_charge: bool = Field(default=True, description="Battery positive charge direction")
+    refresh_interval_seconds: int = Field(
+        default=0, ge=0, description="Background refresh interval in seconds (0 to fetch on demand)"
+    )
+    max_data_age_seconds: int = Field(
+        default=120, gt=0, description="Maximum age in seconds of a background refreshed energy state"
+    )
 
     @field_validator("entity_production", "entity_consumption")
     @classmethod
@@ -587,6 +593,8 @@ class EnergyMonitorHomeAssistantConfigSchema(BaseModel):
             unit_battery_remaining_capacity=self.unit_battery_remaining_capacity,
             grid_positive_export=self.grid_positive_export,
             battery_positive_charge=self.battery_positive_charge,
+            refresh_interval_seconds=self.refresh_interval_seconds,
+            max_data_age_seconds=self.max_data_age_seconds,
         )
 
     class Config:
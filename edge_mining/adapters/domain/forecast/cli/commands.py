@@ -1,6 +1,6 @@
 """CLI commands for the energy forecast domain."""
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 import click
 
@@ -23,24 +23,54 @@ from edge_mining.shared.external_services.entities import ExternalService
 from edge_mining.shared.interfaces.config import ForecastProviderConfig
 from edge_mining.shared.logging.port import LoggerPort
 
+# Forecast provider adapters are fixed at import time, materialize them once
+_FP_ADAPTERS = tuple(ForecastProviderAdapter)
+_FP_ADAPTER_VALUES = tuple(adapter.value for adapter in _FP_ADAPTERS)
+_FP_ADAPTER_LEN = len(_FP_ADAPTERS)
+_ADAPTER_NAME = {adapter: adapter.name for adapter in _FP_ADAPTERS}
+
+# Static menu texts, styled once at import time
+_FORECAST_MENU_BODY = "\n".join(
+    [
+        "\n" + click.style("--- FORECAST ---", fg="yellow", bold=True),
+        "1. Add Forecast Provider",
+        "2. List Forecast Providers",
+        "3. Manage Forecast Provider",
+        "",
+        "b. Back to Main Menu",
+        "q. Quit",
+        "-----------------",
+    ]
+)
+_MANAGE_FP_BANNER = "\n" + click.style("--- MANAGE FORECAST PROVIDER ---", fg="blue", bold=True)
+_MANAGE_FP_BODY = "\n".join(
+    [
+        "1. Update Forecast Provider",
+        "2. Delete Forecast Provider",
+        "",
+        "b. Back to energy menu",
+        "q. Close application",
+        "-----------------",
+    ]
+)
+
 
 def select_forecast_provider_adapter() -> Optional[ForecastProviderAdapter]:
     """Select a forecast provider adapter from the available options."""
     click.echo("Select a Forecast Provider Adapter:")
-    for idx, adapter in enumerate(ForecastProviderAdapter):
+    for idx, adapter in enumerate(_FP_ADAPTERS):
         click.echo(f"{idx}. " + click.style(f"{adapter.name}", fg="blue"))
 
     click.echo("")
     choice: str = click.prompt("Choose a forecast provider adapter", type=str, default="")
     choice = choice.strip().lower()
 
-    if not choice.isdigit() or int(choice) < 0 or int(choice) >= len(ForecastProviderAdapter):
+    idx = int(choice) if choice.isdigit() else -1
+    if not 0 <= idx < _FP_ADAPTER_LEN:
         click.echo(click.style("Invalid index. Aborting selection.", fg="red"))
         return None
 
-    adapter_type_values = [adapter.value for adapter in ForecastProviderAdapter]
-
-    selected_adapter = ForecastProviderAdapter(adapter_type_values[int(choice)])
+    selected_adapter = ForecastProviderAdapter(_FP_ADAPTER_VALUES[idx])
     return selected_adapter
 
 
@@ -65,66 +95,56 @@ def handle_forecast_provider_dummy_config() -> ForecastProviderConfig:
     )
 
 
+# Prompts for the Home Assistant API forecast provider: (config field, label, default)
+_HA_PROMPTS = (
+    ("entity_forecast_power_actual_h", "Entity Forecast Power Actual (h)", ""),
+    ("entity_forecast_power_next_1h", "Entity Forecast Power Next 1h", ""),
+    ("entity_forecast_power_next_12h", "Entity Forecast Power Next 12h", ""),
+    ("entity_forecast_power_next_24h", "Entity Forecast Power Next 24h", ""),
+    ("entity_forecast_energy_actual_h", "Entity Forecast Energy Actual (h)", ""),
+    ("entity_forecast_energy_next_1h", "Entity Forecast Energy Next 1h", ""),
+    ("entity_forecast_energy_today", "Entity Forecast Energy Today", ""),
+    ("entity_forecast_energy_tomorrow", "Entity Forecast Energy Tomorrow", ""),
+    ("entity_forecast_energy_remaining_today", "Entity Forecast Energy Remaining Today", ""),
+    ("unit_forecast_power_actual_h", "Unit Forecast Power Actual (h)", "W"),
+    ("unit_forecast_power_next_1h", "Unit Forecast Power Next 1h", "W"),
+    ("unit_forecast_power_next_12h", "Unit Forecast Power Next 12h", "W"),
+    ("unit_forecast_power_next_24h", "Unit Forecast Power Next 24h", "W"),
+    ("unit_forecast_energy_actual_h", "Unit Forecast Energy Actual (h)", "kWh"),
+    ("unit_forecast_energy_next_1h", "Unit Forecast Energy Next 1h", "kWh"),
+    ("unit_forecast_energy_today", "Unit Forecast Energy Today", "kWh"),
+    ("unit_forecast_energy_tomorrow", "Unit Forecast Energy Tomorrow", "kWh"),
+    ("unit_forecast_energy_remaining_today", "Unit Forecast Energy Remaining Today", "kWh"),
+)
+
+
 def handle_forecast_provider_home_assistant_api_config() -> ForecastProviderConfig:
     """Handle the configuration for the Home Assistant API forecast provider."""
     click.echo(click.style("\n--- Home Assistant API Configuration ---", fg="yellow"))
 
-    entity_forecast_power_actual_h: str = click.prompt("Entity Forecast Power Actual (h)", type=str, default="")
-    entity_forecast_power_next_1h: str = click.prompt("Entity Forecast Power Next 1h", type=str, default="")
-    entity_forecast_power_next_12h: str = click.prompt("Entity Forecast Power Next 12h", type=str, default="")
-    entity_forecast_power_next_24h: str = click.prompt("Entity Forecast Power Next 24h", type=str, default="")
-    entity_forecast_energy_actual_h: str = click.prompt("Entity Forecast Energy Actual (h)", type=str, default="")
-    entity_forecast_energy_next_1h: str = click.prompt("Entity Forecast Energy Next 1h", type=str, default="")
-    entity_forecast_energy_today: str = click.prompt("Entity Forecast Energy Today", type=str, default="")
-    entity_forecast_energy_tomorrow: str = click.prompt("Entity Forecast Energy Tomorrow", type=str, default="")
-    entity_forecast_energy_remaining_today: str = click.prompt(
-        "Entity Forecast Energy Remaining Today", type=str, default=""
-    )
+    values: Dict[str, str] = {
+        name: click.prompt(label, type=str, default=default) for name, label, default in _HA_PROMPTS
+    }
+    cache_ttl_seconds: int = click.prompt("Forecast cache TTL in seconds (0 to disable)", type=int, default=60)
+    return ForecastProviderHomeAssistantConfig(**values, cache_ttl_seconds=cache_ttl_seconds)
 
-    unit_forecast_power_actual_h: str = click.prompt("Unit Forecast Power Actual (h)", type=str, default="W")
-    unit_forecast_power_next_1h: str = click.prompt("Unit Forecast Power Next 1h", type=str, default="W")
-    unit_forecast_power_next_12h: str = click.prompt("Unit Forecast Power Next 12h", type=str, default="W")
-    unit_forecast_power_next_24h: str = click.prompt("Unit Forecast Power Next 24h", type=str, default="W")
-    unit_forecast_energy_actual_h: str = click.prompt("Unit Forecast Energy Actual (h)", type=str, default="kWh")
-    unit_forecast_energy_next_1h: str = click.prompt("Unit Forecast Energy Next 1h", type=str, default="kWh")
-    unit_forecast_energy_today: str = click.prompt("Unit Forecast Energy Today", type=str, default="kWh")
-    unit_forecast_energy_tomorrow: str = click.prompt("Unit Forecast Energy Tomorrow", type=str, default="kWh")
-    unit_forecast_energy_remaining_today: str = click.prompt(
-        "Unit Forecast Energy Remaining Today", type=str, default="kWh"
-    )
-    return ForecastProviderHomeAssistantConfig(
-        entity_forecast_power_actual_h=entity_forecast_power_actual_h,
-        entity_forecast_power_next_1h=entity_forecast_power_next_1h,
-        entity_forecast_power_next_12h=entity_forecast_power_next_12h,
-        entity_forecast_power_next_24h=entity_forecast_power_next_24h,
-        entity_forecast_energy_actual_h=entity_forecast_energy_actual_h,
-        entity_forecast_energy_next_1h=entity_forecast_energy_next_1h,
-        entity_forecast_energy_today=entity_forecast_energy_today,
-        entity_forecast_energy_tomorrow=entity_forecast_energy_tomorrow,
-        entity_forecast_energy_remaining_today=entity_forecast_energy_remaining_today,
-        unit_forecast_power_actual_h=unit_forecast_power_actual_h,
-        unit_forecast_power_next_1h=unit_forecast_power_next_1h,
-        unit_forecast_power_next_12h=unit_forecast_power_next_12h,
-        unit_forecast_power_next_24h=unit_forecast_power_next_24h,
-        unit_forecast_energy_actual_h=unit_forecast_energy_actual_h,
-        unit_forecast_energy_next_1h=unit_forecast_energy_next_1h,
-        unit_forecast_energy_today=unit_forecast_energy_today,
-        unit_forecast_energy_tomorrow=unit_forecast_energy_tomorrow,
-        unit_forecast_energy_remaining_today=unit_forecast_energy_remaining_today,
-    )
+
+# Configuration handler for each forecast provider adapter type
+_FORECAST_CFG_DISPATCH: Dict[ForecastProviderAdapter, Callable[[], ForecastProviderConfig]] = {
+    ForecastProviderAdapter.DUMMY_SOLAR: handle_forecast_provider_dummy_config,
+    ForecastProviderAdapter.HOME_ASSISTANT_API: handle_forecast_provider_home_assistant_api_config,
+}
 
 
 def handle_forecast_provider_configuration(
     adapter_type: ForecastProviderAdapter,
 ) -> Optional[ForecastProviderConfig]:
     """Handle the configuration of a forecast provider based on the selected adapter type."""
-    if adapter_type.value == ForecastProviderAdapter.DUMMY_SOLAR.value:
-        return handle_forecast_provider_dummy_config()
-    elif adapter_type.value == ForecastProviderAdapter.HOME_ASSISTANT_API.value:
-        return handle_forecast_provider_home_assistant_api_config()
-    else:
+    handler = _FORECAST_CFG_DISPATCH.get(adapter_type)
+    if handler is None:
         click.echo(click.style("Unsupported forecast provider adapter type.", fg="red"))
         return None
+    return handler()
 
 
 def handle_add_forecast_provider(
@@ -182,6 +202,15 @@ def handle_add_forecast_provider(
     return added
 
 
+def _render_fp(forecast_provider: ForecastProvider, prefix: str) -> str:
+    """Render a forecast provider as a single styled line of a list."""
+    return (
+        f"{prefix}Name: {click.style(f'{forecast_provider.name}, ', fg='blue')}"
+        f"ID: {click.style(f'{forecast_provider.id}, ', fg='yellow')}"
+        f"Type: {click.style(_ADAPTER_NAME[forecast_provider.adapter_type], fg='green')}"
+    )
+
+
 def handle_list_forecast_providers(configuration_service: ConfigurationServiceInterface, logger: LoggerPort) -> None:
     """List all forecast providers."""
     click.echo(click.style("\n--- List Forecast Providers ---", fg="yellow"))
@@ -190,16 +219,9 @@ def handle_list_forecast_providers(configuration_service: ConfigurationServiceIn
     if not forecast_providers:
         click.echo(click.style("No forecast providers found.", fg="yellow"))
     else:
-        for provider in forecast_providers:
-            click.echo(
-                "-> "
-                + "Name: "
-                + click.style(f"{provider.name}, ", fg="blue")
-                + "ID: "
-                + click.style(f"{provider.id}, ", fg="yellow")
-                + "Type: "
-                + click.style(f"{provider.adapter_type.name}", fg="green")
-            )
+        # Build the whole list and write it at once
+        lines = [_render_fp(provider, "-> ") for provider in forecast_providers]
+        click.echo("\n".join(lines))
 
     click.echo("")
     click.pause("Press any key to return to the menu...")
@@ -224,7 +246,8 @@ def select_forecast_providers(
             "Filtering forecast providers by types: "
             + click.style(f"{', '.join([t.name for t in filter_type])}", fg="blue")
         )
-        forecast_providers = [fp for fp in forecast_providers if fp.adapter_type in filter_type]
+        type_set = set(filter_type)
+        forecast_providers = [fp for fp in forecast_providers if fp.adapter_type in type_set]
 
     filter_config = process_filters(filter_config)
     if filter_config:
@@ -232,12 +255,9 @@ def select_forecast_providers(
             "Filtering forecast providers by config: "
             + click.style(f"{', '.join([type(c).__name__ for c in filter_config])}", fg="blue")
         )
-        filtered_forecast_providers: List[ForecastProvider] = []
-        for fp in forecast_providers:
-            for filtered_config_class in filter_config:
-                if isinstance(fp.config, type(filtered_config_class)):
-                    filtered_forecast_providers.append(fp)
-        forecast_providers = filtered_forecast_providers
+        # A single isinstance check against all the config classes, each provider is kept at most once
+        config_types = tuple({type(c) for c in filter_config})
+        forecast_providers = [fp for fp in forecast_providers if isinstance(fp.config, config_types)]
 
     if not forecast_providers:
         click.echo(click.style("No forecast providers configured.", fg="yellow"))
@@ -245,22 +265,12 @@ def select_forecast_providers(
         return None
 
     default_idx = ""
-    for idx, fp in enumerate(forecast_providers):
-        click.echo(
-            f"{idx}. "
-            + "Name: "
-            + click.style(f"{fp.name}, ", fg="blue")
-            + "ID: "
-            + click.style(f"{fp.id}, ", fg="yellow")
-            + "Type: "
-            + click.style(f"{fp.adapter_type.name}", fg="green")
-        )
-
-        if default_id:
-            if fp.id == default_id:
-                default_idx = str(idx)
+    if default_id:
+        default_idx = str(next((idx for idx, fp in enumerate(forecast_providers) if fp.id == default_id), ""))
 
-    click.echo("\nb. Back to menu\n")
+    lines = [_render_fp(fp, f"{idx}. ") for idx, fp in enumerate(forecast_providers)]
+    lines.append("\nb. Back to menu\n")
+    click.echo("\n".join(lines))
 
     fp_idx: str = click.prompt("Choose a Forecast Provider index", type=str, default=default_idx)
     fp_idx = fp_idx.strip().lower()
@@ -268,11 +278,12 @@ def select_forecast_providers(
     if fp_idx == "b":
         return None
 
-    if not fp_idx.isdigit() or int(fp_idx) < 0 or int(fp_idx) >= len(forecast_providers):
+    idx = int(fp_idx) if fp_idx.isdigit() else -1
+    if not 0 <= idx < len(forecast_providers):
         click.echo(click.style("Invalid index. Aborting selection.", fg="red"))
         return None
 
-    selected_fp = forecast_providers[int(fp_idx)]
+    selected_fp = forecast_providers[idx]
     return selected_fp
 
 
@@ -296,7 +307,7 @@ def print_forecast_provider_details(
     click.echo("")
     click.echo("| Name: " + click.style(forecast_provider.name, fg="blue"))
     click.echo("| ID: " + click.style(forecast_provider.id, fg="yellow"))
-    click.echo("| Adapter: " + click.style(forecast_provider.adapter_type.name, fg="green"))
+    click.echo("| Adapter: " + click.style(_ADAPTER_NAME[forecast_provider.adapter_type], fg="green"))
     click.echo("| External Service ID: " + click.style(forecast_provider.external_service_id or "---", fg="magenta"))
     print_forecast_provider_config(forecast_provider)
     click.echo("")
@@ -492,7 +503,7 @@ def manage_single_forecast_provider_menu(
 ) -> str:
     """Menu for managing a single forecast provider."""
     while True:
-        click.echo("\n" + click.style("--- MANAGE FORECAST PROVIDER ---", fg="blue", bold=True))
+        click.echo(_MANAGE_FP_BANNER)
 
         print_forecast_provider_details(
             forecast_provider=forecast_provider,
@@ -501,12 +512,7 @@ def manage_single_forecast_provider_menu(
             show_external_service=True,
         )
 
-        click.echo("1. Update Forecast Provider")
-        click.echo("2. Delete Forecast Provider")
-        click.echo("")
-        click.echo("b. Back to energy menu")
-        click.echo("q. Close application")
-        click.echo("-----------------")
+        click.echo(_MANAGE_FP_BODY)
 
         choice: str = click.prompt("Choose an option", type=str)
         choice = choice.strip().lower()
@@ -547,14 +553,7 @@ def manage_single_forecast_provider_menu(
 def forecast_menu(configuration_service: ConfigurationServiceInterface, logger: LoggerPort) -> str:
     """Menu for managing Forecast Providers."""
     while True:
-        click.echo("\n" + click.style("--- FORECAST ---", fg="yellow", bold=True))
-        click.echo("1. Add Forecast Provider")
-        click.echo("2. List Forecast Providers")
-        click.echo("3. Manage Forecast Provider")
-        click.echo("")
-        click.echo("b. Back to Main Menu")
-        click.echo("q. Quit")
-        click.echo("-----------------")
+        click.echo(_FORECAST_MENU_BODY)
 
         choice: str = click.prompt("Select an action", type=str).strip().lower()
 
@@ -5,7 +5,7 @@ the energy forecast for Edge Mining Application
 
 import random
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from edge_mining.domain.common import Timestamp, WattHours, Watts
 from edge_mining.domain.energy.entities import EnergySource
@@ -23,6 +23,18 @@ from edge_mining.shared.interfaces.config import Configuration
 from edge_mining.shared.interfaces.factories import ForecastAdapterFactory
 from edge_mining.shared.logging.port import LoggerPort
 
+# Hour of the day with the maximum solar production
+PEAK_HOUR = 13
+
+_ONE_HOUR = timedelta(hours=1)
+
+# Private generator for the forecast noise, bound once (not for cryptographic use)
+_rng_random = random.Random().random
+
+# Noise applied to the solar production, uniform in [NOISE_MIN, 1.0)
+NOISE_MIN = 0.7
+NOISE_SPAN = 1.0 - NOISE_MIN
+
 
 class DummyForecastProviderFactory(ForecastAdapterFactory):
     """
@@ -45,7 +57,10 @@ class DummyForecastProviderFactory(ForecastAdapterFactory):
         """
         Creates a DummySolarForecastProvider instance.
         """
-        if not isinstance(config, ForecastProviderDummySolarConfig):
+        # Exact type check first, the common case, before walking the MRO
+        if type(config) is not ForecastProviderDummySolarConfig and not isinstance(
+            config, ForecastProviderDummySolarConfig
+        ):
             raise ForecastError(
                 "Invalid configuration type for HomeAssistantAPI forecast provider. "
                 "Expected ForecastProviderDummySolarConfig."
@@ -95,55 +110,74 @@ class DummySolarForecastProvider(ForecastProviderPort):
         self.production_end_hour = production_end_hour
         # You can set default values or use the ones from settings if needed
 
+        # Solar factor for every hour of the day, it only depends on the production window.
+        # Simple sinusoidal based on hour, zero outside the production hours.
+        half_production_hours = (production_end_hour - production_start_hour) / 2
+        self._solar_factors: Tuple[float, ...] = tuple(
+            max(0.0, 1 - abs(hour - PEAK_HOUR) / half_production_hours)
+            if production_start_hour < hour < production_end_hour
+            else 0.0
+            for hour in range(24)
+        )
+
+        # Last generated forecast and the (year, month, day, hour) it was generated in
+        self._cache_key: Optional[Tuple[int, int, int, int]] = None
+        self._cache_forecast: Optional[Forecast] = None
+
     def get_forecast(self) -> Optional[Forecast]:
         # Generates a plausible fake solar forecast.
-        if self.logger:
-            self.logger.debug(
+        logger = self.logger
+        now = datetime.now()
+
+        # The forecast has an hourly resolution, reuse the one generated within the same hour
+        cache_key = (now.year, now.month, now.day, now.hour)
+        if cache_key == self._cache_key and self._cache_forecast is not None:
+            if logger:
+                logger.debug("DummySolarForecastProvider: Returning the forecast generated this hour.")
+            return self._cache_forecast
+
+        if logger:
+            logger.debug(
                 f"DummySolarForecastProvider: "
                 f"Generating forecast for {self.latitude},{self.longitude} "
                 f"({self.capacity_kwp} kWp)"
             )
-        now = datetime.now()
         forecast: Forecast = Forecast(timestamp=Timestamp(now))
         base_max_watts = self.capacity_kwp * 1000 * (self.efficiency_percent / 100)
 
-        peak_hour = 13
-        total_production_hours = self.production_end_hour - self.production_start_hour
-
-        for i in range(24):  # Forecast for next 24 hours
-            future_time = now + timedelta(hours=i)
-            hour = future_time.hour
-
-            if self.production_start_hour < hour < self.production_end_hour:
-                # Simple sinusoidal based on hour
-                solar_factor = max(0, 1 - abs(hour - peak_hour) / (total_production_hours / 2))
-                # Add some randomness
-                noise = random.uniform(0.7, 1.0)
-                predicted_power = Watts(base_max_watts * solar_factor * noise)
-            else:
-                predicted_power = Watts(0.0)
-
-            # Generate forecast for energy based on peak power
-            predicted_energy = WattHours(predicted_power)
-
-            # Create a forecast power point for this hour
-            forecast_point = ForecastPowerPoint(timestamp=Timestamp(future_time), power=predicted_power)
-
-            start_time = Timestamp(now) if i == 0 else Timestamp(now + timedelta(hours=i - 1))
-            end_time = Timestamp(future_time)
-
-            # Create a forecast interval for this hour
-            interval = ForecastInterval(
-                start=start_time,
-                end=end_time,
-                energy=predicted_energy,  # Energy in Wh for the hour
-                energy_remaining=None,  # Remaining energy in Wh for the hour
-                power_points=[forecast_point],
-            )
+        solar_factors = self._solar_factors
+
+        # Compute the whole 24 hours power series in one pass, before building the value objects
+        hours = [(now.hour + i) % 24 for i in range(24)]  # Forecast for next 24 hours
+        # Draw all the noise samples at once, random() avoids the Python level uniform() wrapper
+        noise = [NOISE_MIN + NOISE_SPAN * _rng_random() for _ in hours]
+        # Factors are zero outside the production window, so no branch is needed
+        powers = [
+            base_max_watts * solar_factors[hour] * hour_noise for hour, hour_noise in zip(hours, noise, strict=True)
+        ]
+
+        # Interval i ends at now + i hours and starts one hour earlier,
+        # the first one is the actual hour and starts and ends at now.
+        times = [Timestamp(now + i * _ONE_HOUR) for i in range(24)]
+        start_times = [times[0]] + times[:-1]
+
+        # Build all the hourly intervals, energy in Wh for the hour is based on peak power
+        forecast.intervals.extend(
+            [
+                ForecastInterval(
+                    start=start_time,
+                    end=end_time,
+                    energy=WattHours(power),
+                    energy_remaining=None,
+                    power_points=[ForecastPowerPoint(timestamp=end_time, power=Watts(power))],
+                )
+                for power, start_time, end_time in zip(powers, start_times, times, strict=True)
+            ]
+        )
 
-            # Add the forecast interval to the forecast
-            forecast.intervals.append(interval)
+        if logger:
+            logger.debug(f"DummyForecastProvider: Generated {len(forecast.intervals)} predictions.")
 
-        if self.logger:
-            self.logger.debug(f"DummyForecastProvider: Generated {len(forecast.intervals)} predictions.")
+        self._cache_key = cache_key
+        self._cache_forecast = forecast
         return forecast
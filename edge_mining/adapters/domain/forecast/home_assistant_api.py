@@ -3,8 +3,11 @@ Home Assistant API adapter (Implementation of Port)
 for the energy forecast of Edge Mining Application
 """
 
-from datetime import datetime, time, timedelta
-from typing import List, Optional, cast
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple, cast
 
 from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import (
     ServiceHomeAssistantAPI,
@@ -28,6 +31,43 @@ from edge_mining.shared.external_services.ports import ExternalServicePort
 from edge_mining.shared.interfaces.factories import ForecastAdapterFactory
 from edge_mining.shared.logging.port import LoggerPort
 
+# Maximum number of Home Assistant entities fetched at the same time
+MAX_FETCH_WORKERS = 9
+# From this number of entities, all the states are listed with one request
+BULK_FETCH_MIN_ENTITIES = 3
+# Maximum age of a cached forecast returned when a new one cannot be built
+MAX_STALE_FORECAST_AGE = timedelta(hours=1)
+
+_HA_ADAPTER = ForecastProviderAdapter.HOME_ASSISTANT_API
+
+# Offsets of the forecast intervals from the actual hour
+_ONE_HOUR = timedelta(hours=1)
+_TWELVE_HOURS = timedelta(hours=12)
+_ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True, slots=True)
+class _EntitySpec:
+    """Home Assistant entity of a forecast value, with the lowercase unit it is expressed in."""
+
+    entity_id: Optional[str]
+    unit: str
+
+
+@dataclass(frozen=True, slots=True)
+class _ForecastEntities:
+    """Home Assistant entities of all the forecast values."""
+
+    power_actual_h: _EntitySpec
+    power_next_1h: _EntitySpec
+    power_next_12h: _EntitySpec
+    power_next_24h: _EntitySpec
+    energy_actual_h: _EntitySpec
+    energy_next_1h: _EntitySpec
+    energy_today: _EntitySpec
+    energy_tomorrow: _EntitySpec
+    energy_remaining_today: _EntitySpec
+
 
 class HomeAssistantForecastProviderFactory(ForecastAdapterFactory):
     """
@@ -117,6 +157,8 @@ class HomeAssistantForecastProviderFactory(ForecastAdapterFactory):
                 forecast_provider_config.unit_forecast_energy_remaining_today,
             )
 
+        builder.set_cache_ttl(forecast_provider_config.cache_ttl_seconds)
+
         # --- Build the adapter ---
         return builder.build()
 
@@ -146,53 +188,54 @@ class HomeAssistantForecastProviderBuilder:
         self.unit_forecast_energy_today: str = "kWh"
         self.unit_forecast_energy_tomorrow: str = "kWh"
         self.unit_forecast_energy_remaining_today: str = "kWh"
+        self.cache_ttl_seconds: int = 60
 
     def set_actual_power_entity(self, entity_id: str, unit: str = "W") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the actual solar power forecast."""
         self.entity_forecast_power_actual_h = entity_id
-        self.unit_forecast_power_actual_h = unit.lower()
+        self.unit_forecast_power_actual_h = unit
         return self
 
     def set_next_1h_power_entity(self, entity_id: str, unit: str = "W") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the next 1 hour solar power forecast."""
         self.entity_forecast_power_next_1h = entity_id
-        self.unit_forecast_power_next_1h = unit.lower()
+        self.unit_forecast_power_next_1h = unit
         return self
 
     def set_next_12h_power_entity(self, entity_id: str, unit: str = "W") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the next 12 hours solar power forecast."""
         self.entity_forecast_power_next_12h = entity_id
-        self.unit_forecast_power_next_12h = unit.lower()
+        self.unit_forecast_power_next_12h = unit
         return self
 
     def set_next_24h_power_entity(self, entity_id: str, unit: str = "W") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the next 24 hours solar power forecast."""
         self.entity_forecast_power_next_24h = entity_id
-        self.unit_forecast_power_next_24h = unit.lower()
+        self.unit_forecast_power_next_24h = unit
         return self
 
     def set_actual_energy_entity(self, entity_id: str, unit: str = "kWh") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the actual solar energy forecast."""
         self.entity_forecast_energy_actual_h = entity_id
-        self.unit_forecast_energy_actual_h = unit.lower()
+        self.unit_forecast_energy_actual_h = unit
         return self
 
     def set_next_1h_energy_entity(self, entity_id: str, unit: str = "kWh") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the next 1 hour solar energy forecast."""
         self.entity_forecast_energy_next_1h = entity_id
-        self.unit_forecast_energy_next_1h = unit.lower()
+        self.unit_forecast_energy_next_1h = unit
         return self
 
     def set_today_energy_entity(self, entity_id: str, unit: str = "kWh") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the today solar energy forecast."""
         self.entity_forecast_energy_today = entity_id
-        self.unit_forecast_energy_today = unit.lower()
+        self.unit_forecast_energy_today = unit
         return self
 
     def set_tomorrow_energy_entity(self, entity_id: str, unit: str = "kWh") -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the tomorrow solar energy forecast."""
         self.entity_forecast_energy_tomorrow = entity_id
-        self.unit_forecast_energy_tomorrow = unit.lower()
+        self.unit_forecast_energy_tomorrow = unit
         return self
 
     def set_remaining_today_energy_entity(
@@ -200,7 +243,12 @@ class HomeAssistantForecastProviderBuilder:
     ) -> "HomeAssistantForecastProviderBuilder":
         """Sets the entity ID for the remaining energy forecast for today."""
         self.entity_forecast_energy_remaining_today = entity_id
-        self.unit_forecast_energy_remaining_today = unit.lower()
+        self.unit_forecast_energy_remaining_today = unit
+        return self
+
+    def set_cache_ttl(self, seconds: int) -> "HomeAssistantForecastProviderBuilder":
+        """Sets for how many seconds a fetched forecast is reused, 0 disables the cache."""
+        self.cache_ttl_seconds = seconds
         return self
 
     def build(self) -> "HomeAssistantForecastProvider":
@@ -209,27 +257,31 @@ class HomeAssistantForecastProviderBuilder:
             raise ValueError("Entity ID for actual solar power forecast is required.")
         if not self.entity_forecast_energy_actual_h:
             raise ValueError("Entity ID for actual solar energy forecast is required.")
+        if self.cache_ttl_seconds < 0:
+            raise ValueError("Forecast cache TTL must not be negative.")
+
+        entities = _ForecastEntities(
+            power_actual_h=_EntitySpec(self.entity_forecast_power_actual_h, self.unit_forecast_power_actual_h.lower()),
+            power_next_1h=_EntitySpec(self.entity_forecast_power_next_1h, self.unit_forecast_power_next_1h.lower()),
+            power_next_12h=_EntitySpec(self.entity_forecast_power_next_12h, self.unit_forecast_power_next_12h.lower()),
+            power_next_24h=_EntitySpec(self.entity_forecast_power_next_24h, self.unit_forecast_power_next_24h.lower()),
+            energy_actual_h=_EntitySpec(
+                self.entity_forecast_energy_actual_h, self.unit_forecast_energy_actual_h.lower()
+            ),
+            energy_next_1h=_EntitySpec(self.entity_forecast_energy_next_1h, self.unit_forecast_energy_next_1h.lower()),
+            energy_today=_EntitySpec(self.entity_forecast_energy_today, self.unit_forecast_energy_today.lower()),
+            energy_tomorrow=_EntitySpec(
+                self.entity_forecast_energy_tomorrow, self.unit_forecast_energy_tomorrow.lower()
+            ),
+            energy_remaining_today=_EntitySpec(
+                self.entity_forecast_energy_remaining_today, self.unit_forecast_energy_remaining_today.lower()
+            ),
+        )
 
         forecast_provider = HomeAssistantForecastProvider(
             home_assistant=self.home_assistant,
-            entity_forecast_power_actual_h=self.entity_forecast_power_actual_h,
-            entity_forecast_power_next_1h=self.entity_forecast_power_next_1h,
-            entity_forecast_power_next_12h=self.entity_forecast_power_next_12h,
-            entity_forecast_power_next_24h=self.entity_forecast_power_next_24h,
-            entity_forecast_energy_actual_h=self.entity_forecast_energy_actual_h,
-            entity_forecast_energy_next_1h=self.entity_forecast_energy_next_1h,
-            entity_forecast_energy_today=self.entity_forecast_energy_today,
-            entity_forecast_energy_tomorrow=self.entity_forecast_energy_tomorrow,
-            entity_forecast_energy_remaining_today=self.entity_forecast_energy_remaining_today,
-            unit_forecast_power_actual_h=self.unit_forecast_power_actual_h,
-            unit_forecast_power_next_1h=self.unit_forecast_power_next_1h,
-            unit_forecast_power_next_12h=self.unit_forecast_power_next_12h,
-            unit_forecast_power_next_24h=self.unit_forecast_power_next_24h,
-            unit_forecast_energy_actual_h=self.unit_forecast_energy_actual_h,
-            unit_forecast_energy_next_1h=self.unit_forecast_energy_next_1h,
-            unit_forecast_energy_today=self.unit_forecast_energy_today,
-            unit_forecast_energy_tomorrow=self.unit_forecast_energy_tomorrow,
-            unit_forecast_energy_remaining_today=self.unit_forecast_energy_remaining_today,
+            entities=entities,
+            cache_ttl_seconds=self.cache_ttl_seconds,
             logger=self.logger,
         )
 
@@ -243,207 +295,184 @@ class HomeAssistantForecastProvider(ForecastProviderPort):
     Requires careful configuration of entity IDs in the .env file.
     """
 
+    # Forecast values and the Home Assistant service method resolving their unit multiplier
+    _FIELDS = (
+        ("power_actual_h", "power_unit_multiplier"),
+        ("power_next_1h", "power_unit_multiplier"),
+        ("power_next_12h", "power_unit_multiplier"),
+        ("power_next_24h", "power_unit_multiplier"),
+        ("energy_actual_h", "energy_unit_multiplier"),
+        ("energy_next_1h", "energy_unit_multiplier"),
+        ("energy_today", "energy_unit_multiplier"),
+        ("energy_tomorrow", "energy_unit_multiplier"),
+        ("energy_remaining_today", "energy_unit_multiplier"),
+    )
+    _FIELD_NAMES = tuple(name for name, _ in _FIELDS)
+
     def __init__(
         self,
         home_assistant: ServiceHomeAssistantAPI,
-        entity_forecast_power_actual_h: Optional[str],
-        entity_forecast_power_next_1h: Optional[str],
-        entity_forecast_power_next_12h: Optional[str],
-        entity_forecast_power_next_24h: Optional[str],
-        entity_forecast_energy_actual_h: Optional[str],
-        entity_forecast_energy_next_1h: Optional[str],
-        entity_forecast_energy_today: Optional[str],
-        entity_forecast_energy_tomorrow: Optional[str],
-        entity_forecast_energy_remaining_today: Optional[str],
-        unit_forecast_power_actual_h: str = "W",
-        unit_forecast_power_next_1h: str = "W",
-        unit_forecast_power_next_12h: str = "W",
-        unit_forecast_power_next_24h: str = "W",
-        unit_forecast_energy_actual_h: str = "kWh",
-        unit_forecast_energy_next_1h: str = "kWh",
-        unit_forecast_energy_today: str = "kWh",
-        unit_forecast_energy_tomorrow: str = "kWh",
-        unit_forecast_energy_remaining_today: str = "kWh",
+        entities: _ForecastEntities,
+        cache_ttl_seconds: int = 60,
         logger: Optional[LoggerPort] = None,
     ):
         # Initialize the HomeAssistant API Service
-        super().__init__(forecast_provider_type=ForecastProviderAdapter.HOME_ASSISTANT_API)
+        super().__init__(forecast_provider_type=_HA_ADAPTER)
         self.home_assistant = home_assistant
         self.logger = logger
 
-        self.entity_forecast_power_actual_h = entity_forecast_power_actual_h
-        self.entity_forecast_power_next_1h = entity_forecast_power_next_1h
-        self.entity_forecast_power_next_12h = entity_forecast_power_next_12h
-        self.entity_forecast_power_next_24h = entity_forecast_power_next_24h
-        self.entity_forecast_energy_actual_h = entity_forecast_energy_actual_h
-        self.entity_forecast_energy_next_1h = entity_forecast_energy_next_1h
-        self.entity_forecast_energy_today = entity_forecast_energy_today
-        self.entity_forecast_energy_tomorrow = entity_forecast_energy_tomorrow
-        self.entity_forecast_energy_remaining_today = entity_forecast_energy_remaining_today
-        self.unit_forecast_power_actual_h = unit_forecast_power_actual_h.lower()
-        self.unit_forecast_power_next_1h = unit_forecast_power_next_1h.lower()
-        self.unit_forecast_power_next_12h = unit_forecast_power_next_12h.lower()
-        self.unit_forecast_power_next_24h = unit_forecast_power_next_24h.lower()
-        self.unit_forecast_energy_actual_h = unit_forecast_energy_actual_h.lower()
-        self.unit_forecast_energy_next_1h = unit_forecast_energy_next_1h.lower()
-        self.unit_forecast_energy_today = unit_forecast_energy_today.lower()
-        self.unit_forecast_energy_tomorrow = unit_forecast_energy_tomorrow.lower()
-        self.unit_forecast_energy_remaining_today = unit_forecast_energy_remaining_today.lower()
+        # Entity and unit of every forecast value, normalized by the builder
+        self.entities = entities
 
-        if self.logger:
+        # Only the configured values are fetched and parsed on every forecast,
+        # with the multiplier of their unit resolved once. Interned entity IDs
+        # make the lookups in the fetched states compare by identity.
+        self._configured_fields: Tuple[Tuple[str, str, float], ...] = tuple(
+            (name, sys.intern(spec.entity_id), getattr(home_assistant, resolver)(spec.unit, spec.entity_id))
+            for name, resolver in self._FIELDS
+            if (spec := getattr(entities, name)).entity_id
+        )
+        self._entity_ids: List[str] = [entity_id for _, entity_id, _ in self._configured_fields]
+
+        # Last built forecast and when it was built
+        self.cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        self._cache: Optional[Tuple[datetime, Forecast]] = None
+        # When the last attempt to build a new forecast failed, if it did
+        self._failed_at: Optional[datetime] = None
+
+        # Bounds of today and tomorrow, computed again only when the day changes
+        self._day: Optional[date] = None
+        self._end_of_today = Timestamp(datetime.min)
+        self._start_of_tomorrow = Timestamp(datetime.min)
+        self._end_of_tomorrow = Timestamp(datetime.min)
+
+        if self.logger and self.logger.is_debug_enabled():
             self.logger.debug(
                 f"Entities Configured for Power:"
-                f"Actual='{entity_forecast_power_actual_h}', "
-                f"Next 1h='{entity_forecast_power_next_1h}', "
-                f"Next 12h='{entity_forecast_power_next_12h}', "
-                f"Next 24h='{entity_forecast_power_next_24h}'"
+                f"Actual='{entities.power_actual_h.entity_id}', "
+                f"Next 1h='{entities.power_next_1h.entity_id}', "
+                f"Next 12h='{entities.power_next_12h.entity_id}', "
+                f"Next 24h='{entities.power_next_24h.entity_id}'"
             )
             self.logger.debug(
                 f"Entities Configured for Energy:"
-                f"Actual='{entity_forecast_energy_actual_h}', "
-                f"Today='{entity_forecast_energy_next_1h}', "
-                f"Tomorow='{entity_forecast_energy_tomorrow}', "
-                f"Remaining='{entity_forecast_energy_remaining_today}'"
+                f"Actual='{entities.energy_actual_h.entity_id}', "
+                f"Today='{entities.energy_next_1h.entity_id}', "
+                f"Tomorow='{entities.energy_tomorrow.entity_id}', "
+                f"Remaining='{entities.energy_remaining_today.entity_id}'"
             )
 
             self.logger.debug(
                 f"Units for Power:"
-                f"Actual='{unit_forecast_power_actual_h}', "
-                f"Next 1h='{unit_forecast_power_next_1h}', "
-                f"Next 12h='{unit_forecast_power_next_12h}', "
-                f"Next 24h='{unit_forecast_power_next_24h}'"
+                f"Actual='{entities.power_actual_h.unit}', "
+                f"Next 1h='{entities.power_next_1h.unit}', "
+                f"Next 12h='{entities.power_next_12h.unit}', "
+                f"Next 24h='{entities.power_next_24h.unit}'"
             )
             self.logger.debug(
                 f"Units Configured for Energy:"
-                f"Actual='{unit_forecast_energy_actual_h}', "
-                f"Next 1h='{unit_forecast_energy_next_1h}', "
-                f"Today='{unit_forecast_energy_today}', "
-                f"Tomorrow='{unit_forecast_energy_tomorrow}', "
-                f"Remaining='{unit_forecast_energy_remaining_today}'"
+                f"Actual='{entities.energy_actual_h.unit}', "
+                f"Next 1h='{entities.energy_next_1h.unit}', "
+                f"Today='{entities.energy_today.unit}', "
+                f"Tomorrow='{entities.energy_tomorrow.unit}', "
+                f"Remaining='{entities.energy_remaining_today.unit}'"
             )
 
+    def _fetch_states(self, entity_ids: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Fetches the state and unit of the given entities.
+        With several entities, all the states are listed with a single request.
+        Otherwise, or if listing fails, requests to Home Assistant run in parallel
+        threads, since they are blocking, so the total time is the one of the
+        slowest request instead of the sum.
+        """
+        unique_ids = list(dict.fromkeys(entity_ids))
+        if len(unique_ids) >= BULK_FETCH_MIN_ENTITIES:
+            states = self.home_assistant.get_entity_states(unique_ids)
+            if states is not None:
+                return states
+
+        if len(unique_ids) <= 1:
+            return {entity_id: self.home_assistant.get_entity_state(entity_id) for entity_id in unique_ids}
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(unique_ids), MAX_FETCH_WORKERS), thread_name_prefix="ha-forecast"
+        ) as executor:
+            return dict(zip(unique_ids, executor.map(self.home_assistant.get_entity_state, unique_ids), strict=True))
+
+    @staticmethod
+    def _build_interval(
+        start: Timestamp,
+        end: Timestamp,
+        energy: Optional[float] = None,
+        energy_remaining: Optional[float] = None,
+        power: Optional[float] = None,
+    ) -> ForecastInterval:
+        """Builds a forecast interval with its power at the end."""
+        return ForecastInterval(
+            start=start,
+            end=end,
+            energy=WattHours(energy) if energy else None,
+            energy_remaining=WattHours(energy_remaining) if energy_remaining else None,
+            power_points=[ForecastPowerPoint(timestamp=end, power=Watts(power))] if power is not None else [],
+        )
+
     def get_forecast(self) -> Optional[Forecast]:
         """Fetches the energy production forecast."""
+        # Forecast entities change every few minutes, reuse the last forecast while it is fresh
+        fetched_at = datetime.now()
+        if self._cache:
+            if fetched_at - self._cache[0] < self.cache_ttl:
+                if self.logger:
+                    self.logger.debug("Returning the cached forecast from Home Assistant.")
+                return self._cache[1]
+            # After a failure, keep the stale forecast for a TTL instead of fetching all the entities again
+            if (
+                self._failed_at
+                and fetched_at - self._failed_at < self.cache_ttl
+                and fetched_at - self._cache[0] < MAX_STALE_FORECAST_AGE
+            ):
+                if self.logger:
+                    self.logger.debug("Returning the stale forecast from Home Assistant, retrying later.")
+                return self._cache[1]
+
         if self.logger:
             self.logger.debug("Fetching forecast energy state from Home Assistant...")
         has_critical_error = False
 
-        # --- Actual Power h ---
-        if self.entity_forecast_power_actual_h:
-            state_forecast_power_actual_h, _ = self.home_assistant.get_entity_state(self.entity_forecast_power_actual_h)
-            power_actual_h = self.home_assistant.parse_power(
-                state_forecast_power_actual_h,
-                self.unit_forecast_power_actual_h,
-                self.entity_forecast_power_actual_h or "N/A",
-            )
-        else:
-            power_actual_h = None
-
-        # --- Next Power 1h ---
-        if self.entity_forecast_power_next_1h:
-            state_forecast_power_next_1h, _ = self.home_assistant.get_entity_state(self.entity_forecast_power_next_1h)
-            power_next_1h = self.home_assistant.parse_power(
-                state_forecast_power_next_1h,
-                self.unit_forecast_power_next_1h,
-                self.entity_forecast_power_next_1h or "N/A",
-            )
-        else:
-            power_next_1h = None
-
-        # --- Next Power 12h ---
-        if self.entity_forecast_power_next_12h:
-            state_forecast_power_next_12h, _ = self.home_assistant.get_entity_state(self.entity_forecast_power_next_12h)
-            power_next_12h = self.home_assistant.parse_power(
-                state_forecast_power_next_12h,
-                self.unit_forecast_power_next_12h,
-                self.entity_forecast_power_next_12h or "N/A",
-            )
-        else:
-            power_next_12h = None
-
-        # --- Next Power 24h ---
-        if self.entity_forecast_power_next_24h:
-            state_forecast_power_next_24h, _ = self.home_assistant.get_entity_state(self.entity_forecast_power_next_24h)
-            power_next_24h = self.home_assistant.parse_power(
-                state_forecast_power_next_24h,
-                self.unit_forecast_power_next_24h,
-                self.entity_forecast_power_next_24h or "N/A",
-            )
-        else:
-            power_next_24h = None
+        entities = self.entities
 
-        # --- Actual Energy h ---
-        if self.entity_forecast_energy_actual_h:
-            state_forecast_energy_actual_h, _ = self.home_assistant.get_entity_state(
-                self.entity_forecast_energy_actual_h
-            )
-            energy_actual_h = self.home_assistant.parse_energy(
-                state_forecast_energy_actual_h,
-                self.unit_forecast_energy_actual_h,
-                self.entity_forecast_energy_actual_h or "N/A",
-            )
-        else:
-            energy_actual_h = None
-
-        # --- Next Energy 1h ---
-        if self.entity_forecast_energy_next_1h:
-            state_forecast_energy_next_1h, _ = self.home_assistant.get_entity_state(self.entity_forecast_energy_next_1h)
-            energy_next_1h = self.home_assistant.parse_energy(
-                state_forecast_energy_next_1h,
-                self.unit_forecast_energy_next_1h,
-                self.entity_forecast_energy_next_1h or "N/A",
-            )
-        else:
-            energy_next_1h = None
-
-        # --- Today Energy ---
-        if self.entity_forecast_energy_today:
-            state_forecast_energy_today, _ = self.home_assistant.get_entity_state(self.entity_forecast_energy_today)
-            energy_today = self.home_assistant.parse_energy(
-                state_forecast_energy_today,
-                self.unit_forecast_energy_today,
-                self.entity_forecast_energy_today or "N/A",
-            )
-        else:
-            energy_today = None
+        # Fetch all the configured entities at once
+        states = self._fetch_states(self._entity_ids)
 
-        # --- Tomorrow Energy ---
-        if self.entity_forecast_energy_tomorrow:
-            state_forecast_energy_tomorrow, _ = self.home_assistant.get_entity_state(
-                self.entity_forecast_energy_tomorrow
-            )
-            energy_tomorrow = self.home_assistant.parse_energy(
-                state_forecast_energy_tomorrow,
-                self.unit_forecast_energy_tomorrow,
-                self.entity_forecast_energy_tomorrow or "N/A",
-            )
-        else:
-            energy_tomorrow = None
+        # Parse every configured value with its unit, the others stay None
+        values: Dict[str, Optional[float]] = dict.fromkeys(self._FIELD_NAMES)
+        parse_scaled = self.home_assistant.parse_scaled
+        for name, entity_id, multiplier in self._configured_fields:
+            state, _ = states[entity_id]
+            values[name] = parse_scaled(state, multiplier, entity_id)
 
-        # --- Remaining Energy Today ---
-        if self.entity_forecast_energy_remaining_today:
-            state_forecast_energy_remaining_today, _ = self.home_assistant.get_entity_state(
-                self.entity_forecast_energy_remaining_today
-            )
-            energy_remaining_today = self.home_assistant.parse_energy(
-                state_forecast_energy_remaining_today,
-                self.unit_forecast_energy_remaining_today,
-                self.entity_forecast_energy_remaining_today or "N/A",
-            )
-        else:
-            energy_remaining_today = None
+        power_actual_h = values["power_actual_h"]
+        power_next_1h = values["power_next_1h"]
+        power_next_12h = values["power_next_12h"]
+        power_next_24h = values["power_next_24h"]
+        energy_actual_h = values["energy_actual_h"]
+        energy_next_1h = values["energy_next_1h"]
+        energy_today = values["energy_today"]
+        energy_tomorrow = values["energy_tomorrow"]
+        energy_remaining_today = values["energy_remaining_today"]
 
         # Check if essential values are missing
-        if energy_today is None and self.entity_forecast_energy_today:
+        if energy_today is None and entities.energy_today.entity_id:
             if self.logger:
                 self.logger.error(
-                    f"Missing critical value: Solar Production (Entity: {self.entity_forecast_energy_today})"
+                    f"Missing critical value: Solar Production (Entity: {entities.energy_today.entity_id})"
                 )
             has_critical_error = True
-        if energy_tomorrow is None and self.entity_forecast_energy_tomorrow:
+        if energy_tomorrow is None and entities.energy_tomorrow.entity_id:
             if self.logger:
                 self.logger.error(
-                    f"Missing critical value: Solar Production (Entity: {self.entity_forecast_energy_tomorrow})"
+                    f"Missing critical value: Solar Production (Entity: {entities.energy_tomorrow.entity_id})"
                 )
             has_critical_error = True
 
@@ -455,103 +484,72 @@ class HomeAssistantForecastProvider(ForecastProviderPort):
                     "Failed to retrieve one or more critical energy values "
                     "from Home Assistant. Cannot create forecast data."
                 )
+            self._failed_at = fetched_at
+            # Fall back to the last forecast, if it is not too old
+            if self._cache and fetched_at - self._cache[0] < MAX_STALE_FORECAST_AGE:
+                if self.logger:
+                    self.logger.warning(f"Using the last forecast fetched from Home Assistant at {self._cache[0]}.")
+                return self._cache[1]
             return None
 
-        now = Timestamp(datetime.now())
-        actual_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
-        end_of_today = datetime.combine(now, time.max)
+        # A single reading of the clock, so the forecast timestamp and its intervals agree
+        now = datetime.now()
+        actual_hour = now.replace(minute=0, second=0, microsecond=0)
+        if now.date() != self._day:
+            self._day = now.date()
+            end_of_today = datetime.combine(now, time.max)
+            self._end_of_today = Timestamp(end_of_today)
+            self._start_of_tomorrow = Timestamp(end_of_today + timedelta(seconds=1))
+            self._end_of_tomorrow = Timestamp(end_of_today + _ONE_DAY)
 
         forecast: Forecast = Forecast(timestamp=Timestamp(now))
 
-        # Create forecast intervals
-        forecast_interval_actual_h = ForecastInterval(
-            start=Timestamp(actual_hour),
-            end=Timestamp(actual_hour),
-            energy=WattHours(energy_actual_h) if energy_actual_h else None,
-            energy_remaining=None,
-            power_points=[],
-        )
-        forecast_interval_1h = ForecastInterval(
-            start=Timestamp(actual_hour),
-            end=Timestamp(actual_hour + timedelta(hours=1)),
-            energy=WattHours(energy_next_1h) if energy_next_1h else None,
-            energy_remaining=None,
-            power_points=[],
-        )
-        forecast_interval_12h = ForecastInterval(
-            start=Timestamp(actual_hour),
-            end=Timestamp(actual_hour + timedelta(hours=12)),
-            energy=None,
-            energy_remaining=None,
-            power_points=[],
-        )
-        forecast_interval_24h = ForecastInterval(
-            start=Timestamp(actual_hour),
-            end=Timestamp(actual_hour + timedelta(hours=24)),
-            energy=None,
-            energy_remaining=None,
-            power_points=[],
-        )
-        forecast_interval_today = ForecastInterval(
-            start=Timestamp(actual_hour),
-            end=Timestamp(end_of_today),
-            energy=WattHours(energy_today) if energy_today else None,
-            energy_remaining=WattHours(energy_remaining_today) if energy_remaining_today else None,
-            power_points=[],
-        )
-        forecast_interval_tomorrow = ForecastInterval(
-            start=Timestamp(end_of_today + timedelta(seconds=1)),
-            end=Timestamp(end_of_today + timedelta(days=1)),
-            energy=WattHours(energy_tomorrow) if energy_tomorrow else None,
-            energy_remaining=None,
-            power_points=[],
-        )
-
-        # Add power data
-        if power_actual_h is not None:
-            forecast_interval_actual_h.power_points.append(
-                ForecastPowerPoint(
-                    timestamp=Timestamp(actual_hour),
-                    power=Watts(power_actual_h),
-                )
+        # Create forecast intervals, only the ones that contain data
+        intervals = forecast.intervals
+        ts_actual_hour = Timestamp(actual_hour)
+        if power_actual_h is not None or energy_actual_h:
+            intervals.append(
+                self._build_interval(ts_actual_hour, ts_actual_hour, energy=energy_actual_h, power=power_actual_h)
             )
-        if power_next_1h is not None:
-            forecast_interval_1h.power_points.append(
-                ForecastPowerPoint(
-                    timestamp=Timestamp(actual_hour + timedelta(hours=1)),
-                    power=Watts(power_next_1h),
+        if power_next_1h is not None or energy_next_1h:
+            intervals.append(
+                self._build_interval(
+                    ts_actual_hour,
+                    Timestamp(actual_hour + _ONE_HOUR),
+                    energy=energy_next_1h,
+                    power=power_next_1h,
                 )
             )
         if power_next_12h is not None:
-            forecast_interval_12h.power_points.append(
-                ForecastPowerPoint(
-                    timestamp=Timestamp(actual_hour + timedelta(hours=12)),
-                    power=Watts(power_next_12h),
-                )
+            intervals.append(
+                self._build_interval(ts_actual_hour, Timestamp(actual_hour + _TWELVE_HOURS), power=power_next_12h)
             )
         if power_next_24h is not None:
-            forecast_interval_24h.power_points.append(
-                ForecastPowerPoint(
-                    timestamp=Timestamp(actual_hour + timedelta(hours=24)),
-                    power=Watts(power_next_24h),
+            intervals.append(
+                self._build_interval(ts_actual_hour, Timestamp(actual_hour + _ONE_DAY), power=power_next_24h)
+            )
+        if energy_today or energy_remaining_today:
+            intervals.append(
+                self._build_interval(
+                    ts_actual_hour,
+                    self._end_of_today,
+                    energy=energy_today,
+                    energy_remaining=energy_remaining_today,
+                )
+            )
+        if energy_tomorrow:
+            intervals.append(
+                self._build_interval(
+                    self._start_of_tomorrow,
+                    self._end_of_tomorrow,
+                    energy=energy_tomorrow,
                 )
             )
 
-        forecast_intervals: List[ForecastInterval] = [
-            forecast_interval_actual_h,
-            forecast_interval_1h,
-            forecast_interval_12h,
-            forecast_interval_24h,
-            forecast_interval_today,
-            forecast_interval_tomorrow,
-        ]
-
-        # Add intervals to forecast if they contain data
-        for interval in forecast_intervals:
-            if interval.power_points or interval.energy is not None or interval.energy_remaining is not None:
-                forecast.intervals.append(interval)
-
-        if self.logger:
+        if self.logger and self.logger.is_debug_enabled():
             self.logger.debug(f"HA Monitor: Forecast Intervals fetched: {forecast.intervals}")
 
+        if self.cache_ttl:
+            self._cache = (fetched_at, forecast)
+        self._failed_at = None
         return forecast
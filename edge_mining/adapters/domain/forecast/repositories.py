@@ -2,7 +2,9 @@
 
 import json
 import sqlite3
-from typing import List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
 
 from edge_mining.adapters.infrastructure.persistence.sqlite import BaseSqliteRepository
 from edge_mining.domain.common import EntityId
@@ -19,6 +21,17 @@ from edge_mining.domain.forecast.ports import ForecastProviderRepository
 from edge_mining.shared.adapter_maps.forecast import FORECAST_PROVIDER_CONFIG_TYPE_MAP
 from edge_mining.shared.interfaces.config import ForecastProviderConfig
 
+
+@lru_cache(maxsize=128)
+def _load_config_json(config_json: str) -> dict:
+    """
+    Parses a stored configuration, reusing the result for configurations read again.
+    The returned dict is shared and must not be modified.
+    """
+    data: dict = json.loads(config_json)
+    return data
+
+
 # Simple In-Memory implementation for testing and basic use
 
 
@@ -26,41 +39,71 @@ class InMemoryForecastProviderRepository(ForecastProviderRepository):
     """In-memory implementation of ForecastProviderRepository for testing purposes."""
 
     def __init__(self):
-        self._forecast_providers: List[ForecastProvider] = []
+        self._forecast_providers: Dict[EntityId, ForecastProvider] = {}
+        # Forecast provider IDs indexed by the external service they use. The indexed
+        # external service of each provider is kept too, since entities can be updated in place.
+        self._by_external_service: Dict[EntityId, Set[EntityId]] = defaultdict(set)
+        self._indexed_external_service: Dict[EntityId, EntityId] = {}
+
+    def _index(self, forecast_provider: ForecastProvider) -> None:
+        if forecast_provider.external_service_id:
+            self._by_external_service[forecast_provider.external_service_id].add(forecast_provider.id)
+            self._indexed_external_service[forecast_provider.id] = forecast_provider.external_service_id
+
+    def _unindex(self, forecast_provider_id: EntityId) -> None:
+        external_service_id = self._indexed_external_service.pop(forecast_provider_id, None)
+        if external_service_id:
+            self._by_external_service[external_service_id].discard(forecast_provider_id)
 
     def add(self, forecast_provider: ForecastProvider) -> None:
-        self._forecast_providers.append(forecast_provider)
+        self._unindex(forecast_provider.id)
+        self._forecast_providers[forecast_provider.id] = forecast_provider
+        self._index(forecast_provider)
 
     def get_by_id(self, forecast_provider_id: EntityId) -> Optional[ForecastProvider]:
-        for forecast_provider in self._forecast_providers:
-            if forecast_provider.id == forecast_provider_id:
-                return forecast_provider
-        return None
+        return self._forecast_providers.get(forecast_provider_id)
 
     def get_all(self) -> List[ForecastProvider]:
-        return self._forecast_providers
+        return list(self._forecast_providers.values())
 
     def update(self, forecast_provider: ForecastProvider) -> None:
-        for i, existing_forecast_provider in enumerate(self._forecast_providers):
-            if existing_forecast_provider.id == forecast_provider.id:
-                self._forecast_providers[i] = forecast_provider
-                return
+        if forecast_provider.id not in self._forecast_providers:
+            return
+        self._unindex(forecast_provider.id)
+        self._forecast_providers[forecast_provider.id] = forecast_provider
+        self._index(forecast_provider)
 
     def remove(self, forecast_provider_id: EntityId) -> None:
-        self._forecast_providers = [n for n in self._forecast_providers if n.id != forecast_provider_id]
+        self._forecast_providers.pop(forecast_provider_id, None)
+        self._unindex(forecast_provider_id)
 
     def get_by_external_service_id(self, external_service_id: EntityId) -> List[ForecastProvider]:
         """Get all forecast providers associated with a specific external service ID."""
-        return (
-            [fp for fp in self._forecast_providers if fp.external_service_id == external_service_id]
-            if external_service_id
-            else []
-        )
+        if not external_service_id:
+            return []
+        return [
+            self._forecast_providers[forecast_provider_id]
+            for forecast_provider_id in self._by_external_service.get(external_service_id, ())
+        ]
 
 
 class SqliteForecastProviderRepository(ForecastProviderRepository):
     """SQLite implementation of ForecastProviderRepository."""
 
+    _SQL_INSERT = """
+        INSERT INTO forecast_providers (id, name, adapter_type, config, external_service_id)
+        VALUES (?, ?, ?, ?, ?);
+    """
+    _SQL_GET_BY_ID = "SELECT * FROM forecast_providers WHERE id = ?;"
+    _SQL_GET_ALL = "SELECT * FROM forecast_providers;"
+    _SQL_UPDATE = """
+        UPDATE forecast_providers
+        SET name = ?, adapter_type = ?, config = ?, external_service_id = ?
+        WHERE id = ?;
+    """
+    _SQL_DELETE = "DELETE FROM forecast_providers WHERE id = ?;"
+    _SQL_GET_BY_EXTERNAL_SERVICE_ID = "SELECT * FROM forecast_providers WHERE external_service_id = ?;"
+
     def __init__(self, db: BaseSqliteRepository):
         self._db = db
         self.logger = db.logger
@@ -79,7 +122,12 @@ class SqliteForecastProviderRepository(ForecastProviderRepository):
                 config TEXT, -- JSON object of config
                 external_service_id TEXT -- Optional ID for external service integration
             );
+            """,
             """
+            CREATE INDEX IF NOT EXISTS idx_forecast_providers_external_service_id
+            ON forecast_providers(external_service_id)
+            WHERE external_service_id IS NOT NULL;
+            """,
         ]
         conn = self._db.get_connection()
         try:
@@ -98,19 +146,13 @@ class SqliteForecastProviderRepository(ForecastProviderRepository):
 
     def _deserialize_config(self, adapter_type: ForecastProviderAdapter, config_json: str) -> ForecastProviderConfig:
         """Deserialize a JSON string into ForecastProviderConfig object."""
-        data: dict = json.loads(config_json)
-
-        if adapter_type not in FORECAST_PROVIDER_CONFIG_TYPE_MAP:
-            raise ForecastProviderConfigurationError(
-                f"Error reading ForecastProvider configuration. Invalid type '{adapter_type}'"
-            )
-
         config_class: Optional[type[ForecastProviderConfig]] = FORECAST_PROVIDER_CONFIG_TYPE_MAP.get(adapter_type)
         if not config_class:
             raise ForecastProviderConfigurationError(
-                f"Error creating ForecastProvider configuration. Type '{adapter_type}'"
+                f"Error reading ForecastProvider configuration. Invalid type '{adapter_type}'"
             )
 
+        data: dict = _load_config_json(config_json)
         config_instance = config_class.from_dict(data)
         if not isinstance(config_instance, ForecastProviderConfig):
             raise ForecastProviderConfigurationError(
@@ -139,162 +181,124 @@ class SqliteForecastProviderRepository(ForecastProviderRepository):
             self.logger.error(f"Error deserializing ForecastProvider from DB row: {row}. Error: {e}")
             return None
 
+    def _rows_to_forecast_providers(self, rows: Iterable[sqlite3.Row]) -> List[ForecastProvider]:
+        """Deserialize the rows streamed from a cursor, skipping the invalid ones."""
+        return [
+            forecast_provider
+            for forecast_provider in map(self._row_to_forecast_provider, rows)
+            if forecast_provider is not None
+        ]
+
     def add(self, forecast_provider: ForecastProvider) -> None:
         """Add a new forecast provider to the repository."""
         self.logger.debug(f"Adding forecast provider {forecast_provider.id} to SQLite repository.")
-        sql = """
-            INSERT INTO forecast_providers (id, name, adapter_type, config, external_service_id)
-            VALUES (?, ?, ?, ?, ?);
-        """
-        conn = self._db.get_connection()
-        try:
-            # Serialize config to JSON for storage
-            config_json: str = ""
-            if forecast_provider.config:
-                config_json = json.dumps(forecast_provider.config.to_dict())
-
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    sql,
-                    (
-                        forecast_provider.id,
-                        forecast_provider.name,
-                        forecast_provider.adapter_type.value,
-                        config_json,
-                        forecast_provider.external_service_id,
-                    ),
-                )
-        except sqlite3.IntegrityError as e:
-            self.logger.error(f"Integrity error adding forecast provider {forecast_provider.id}: {e}")
-            # Could mean that the ID already exists
-            raise ForecastProviderAlreadyExistsError(
-                f"forecast provider with ID {forecast_provider.id} already exists or constraint violation: {e}"
-            ) from e
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error adding forecast provider {forecast_provider.id}: {e}")
-            raise ForecastProviderError(f"DB error adding forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        # Serialize config to JSON for storage
+        config_json: str = ""
+        if forecast_provider.config:
+            config_json = json.dumps(forecast_provider.config.to_dict())
+
+        with self._db.shared_connection() as conn:
+            try:
+                with conn:
+                    conn.execute(
+                        self._SQL_INSERT,
+                        (
+                            forecast_provider.id,
+                            forecast_provider.name,
+                            forecast_provider.adapter_type.value,
+                            config_json,
+                            forecast_provider.external_service_id,
+                        ),
+                    )
+            except sqlite3.IntegrityError as e:
+                self.logger.error(f"Integrity error adding forecast provider {forecast_provider.id}: {e}")
+                # Could mean that the ID already exists
+                raise ForecastProviderAlreadyExistsError(
+                    f"forecast provider with ID {forecast_provider.id} already exists or constraint violation: {e}"
+                ) from e
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error adding forecast provider {forecast_provider.id}: {e}")
+                raise ForecastProviderError(f"DB error adding forecast provider: {e}") from e
 
     def get_by_id(self, forecast_provider_id: EntityId) -> Optional[ForecastProvider]:
         """Retrieve a forecast provider by its ID."""
         self.logger.debug(f"Retrieving forecast provider {forecast_provider_id} from SQLite repository.")
-        sql = "SELECT * FROM forecast_providers WHERE id = ?;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql, (forecast_provider_id,))
-            row = cursor.fetchone()
-            return self._row_to_forecast_provider(row)
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error retrieving forecast provider {forecast_provider_id}: {e}")
-            raise ForecastProviderNotFoundError(f"DB error retrieving forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                row = conn.execute(self._SQL_GET_BY_ID, (forecast_provider_id,)).fetchone()
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error retrieving forecast provider {forecast_provider_id}: {e}")
+                raise ForecastProviderNotFoundError(f"DB error retrieving forecast provider: {e}") from e
+        return self._row_to_forecast_provider(row)
 
     def get_all(self) -> List[ForecastProvider]:
         """Retrieve all forecast providers from the repository."""
         self.logger.debug("Retrieving all forecast providers from SQLite repository.")
-        sql = "SELECT * FROM forecast_providers;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql)
-            rows = cursor.fetchall()
-            forecast_providers = []
-            for row in rows:
-                forecast_provider = self._row_to_forecast_provider(row)
-                if forecast_provider:
-                    forecast_providers.append(forecast_provider)
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error retrieving all forecast providers: {e}")
-            return []
-        finally:
-            if conn:
-                conn.close()
-        return forecast_providers
+        with self._db.shared_connection() as conn:
+            try:
+                cursor = conn.execute(self._SQL_GET_ALL)
+                return self._rows_to_forecast_providers(cursor)
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error retrieving all forecast providers: {e}")
+                return []
 
     def update(self, forecast_provider: ForecastProvider) -> None:
         """Update an existing forecast provider in the repository."""
         self.logger.debug(f"Updating forecast provider {forecast_provider.id} in SQLite repository.")
-        sql = """
-            UPDATE forecast_providers
-            SET name = ?, adapter_type = ?, config = ?, external_service_id = ?
-            WHERE id = ?;
-        """
-        conn = self._db.get_connection()
-        try:
-            # Serialize config to JSON for storage
-            config_json: str = ""
-            if forecast_provider.config:
-                config_json = json.dumps(forecast_provider.config.to_dict())
-
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    sql,
-                    (
-                        forecast_provider.name,
-                        forecast_provider.adapter_type.value,
-                        config_json,
-                        forecast_provider.external_service_id,
-                        forecast_provider.id,
-                    ),
-                )
-                if cursor.rowcount == 0:
-                    raise ForecastProviderNotFoundError(f"Forecast Provider with ID {forecast_provider.id} not found.")
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error updating forecast provider {forecast_provider.id}: {e}")
-            raise ForecastProviderError(f"DB error updating forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        # Serialize config to JSON for storage
+        config_json: str = ""
+        if forecast_provider.config:
+            config_json = json.dumps(forecast_provider.config.to_dict())
+
+        with self._db.shared_connection() as conn:
+            try:
+                with conn:
+                    cursor = conn.execute(
+                        self._SQL_UPDATE,
+                        (
+                            forecast_provider.name,
+                            forecast_provider.adapter_type.value,
+                            config_json,
+                            forecast_provider.external_service_id,
+                            forecast_provider.id,
+                        ),
+                    )
+                    if cursor.rowcount == 0:
+                        raise ForecastProviderNotFoundError(
+                            f"Forecast Provider with ID {forecast_provider.id} not found."
+                        )
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error updating forecast provider {forecast_provider.id}: {e}")
+                raise ForecastProviderError(f"DB error updating forecast provider: {e}") from e
 
     def remove(self, forecast_provider_id: EntityId) -> None:
         """Remove a forecast provider from the repository."""
         self.logger.debug(f"Removing forecast provider {forecast_provider_id} from SQLite repository.")
-        sql = "DELETE FROM forecast_providers WHERE id = ?;"
-        conn = self._db.get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(sql, (forecast_provider_id,))
-                if cursor.rowcount == 0:
-                    self.logger.warning(f"Attempted to remove non-existent forecast provider {forecast_provider_id}.")
-                    # There is no need to raise an exception here, removing a
-                    # non-existent is idempotent.
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error removing forecast provider {forecast_provider_id}: {e}")
-            raise ForecastProviderError(f"DB error removing forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                with conn:
+                    cursor = conn.execute(self._SQL_DELETE, (forecast_provider_id,))
+                    if cursor.rowcount == 0:
+                        self.logger.warning(
+                            f"Attempted to remove non-existent forecast provider {forecast_provider_id}."
+                        )
+                        # There is no need to raise an exception here, removing a
+                        # non-existent is idempotent.
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error removing forecast provider {forecast_provider_id}: {e}")
+                raise ForecastProviderError(f"DB error removing forecast provider: {e}") from e
 
     def get_by_external_service_id(self, external_service_id: EntityId) -> List[ForecastProvider]:
         """Get all forecast providers associated with a specific external service ID."""
         self.logger.debug(
             f"Retrieving forecast providers for external service {external_service_id} from SQLite repository."
         )
-        sql = "SELECT * FROM forecast_providers WHERE external_service_id = ?;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql, (external_service_id,))
-            rows = cursor.fetchall()
-            forecast_providers = []
-            for row in rows:
-                forecast_provider = self._row_to_forecast_provider(row)
-                if forecast_provider:
-                    forecast_providers.append(forecast_provider)
-            return forecast_providers
-        except sqlite3.Error as e:
-            self.logger.error(
-                f"SQLite error retrieving forecast providers for external service {external_service_id}: {e}"
-            )
-            return []
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                cursor = conn.execute(self._SQL_GET_BY_EXTERNAL_SERVICE_ID, (external_service_id,))
+                return self._rows_to_forecast_providers(cursor)
+            except sqlite3.Error as e:
+                self.logger.error(
+                    f"SQLite error retrieving forecast providers for external service {external_service_id}: {e}"
+                )
+                return []
@@ -13,6 +13,8 @@ from edge_mining.domain.home_load.ports import HomeForecastProviderPort
 from edge_mining.domain.home_load.value_objects import ConsumptionForecast
 from edge_mining.shared.logging.port import LoggerPort
 
+_ONE_HOUR = timedelta(hours=1)
+
 
 class DummyHomeForecastProvider(HomeForecastProviderPort):
     """Generates a very basic fake home load forecast."""
@@ -23,6 +25,8 @@ class DummyHomeForecastProvider(HomeForecastProviderPort):
         self.logger = logger
 
         self.load_power_max = load_power_max
+        # Private generator, not shared with the other users of the random module
+        self._rng = random.Random()
         # You can set default values or use the ones from settings if needed
 
     def get_home_consumption_forecast(self, hours_ahead: int = 3) -> Optional[ConsumptionForecast]:
@@ -36,18 +40,17 @@ class DummyHomeForecastProvider(HomeForecastProviderPort):
             )
 
         now = datetime.now()
-        predictions: Dict[Timestamp, Watts] = {}
 
         # Average Watts expected for the next hours
         # For simplicity, we just generate a random load value
         # In a real scenario, this would be based on historical data, time of day, etc.
         # Here we assume a random load between 200W and max load
-        avg_load = Watts(random.uniform(200, self.load_power_max))
+        avg_load = Watts(self._rng.uniform(200, self.load_power_max))
 
-        for i in range(hours_ahead):  # Forecast for next hours_ahead hours
-            future_time = now + timedelta(hours=i)
-            predicted_power = avg_load
-            predictions[Timestamp(future_time)] = predicted_power
+        # Forecast for next hours_ahead hours, all with the same load
+        predictions: Dict[Timestamp, Watts] = dict.fromkeys(
+            (Timestamp(now + i * _ONE_HOUR) for i in range(hours_ahead)), avg_load
+        )
 
         home_forecast = ConsumptionForecast(predicted_watts=predictions, generated_at=Timestamp(now))
 
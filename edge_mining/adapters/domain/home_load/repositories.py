@@ -1,10 +1,12 @@
 """Repositories for the Home loads domain."""
 
-import copy
 import json
 import sqlite3
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from edge_mining.adapters.infrastructure.persistence.sqlite import BaseSqliteRepository
 from edge_mining.domain.common import EntityId
@@ -27,6 +29,26 @@ from edge_mining.shared.adapter_maps.home_load import (
 )
 from edge_mining.shared.interfaces.config import HomeForecastProviderConfig
 
+
+@lru_cache(maxsize=128)
+def _load_config_json(config_json: str) -> dict:
+    """
+    Parses a stored configuration, reusing the result for configurations read again.
+    The returned dict is shared and must not be modified.
+    """
+    data: dict = json.loads(config_json)
+    return data
+
+
+def _copy_profile(profile: HomeLoadsProfile) -> HomeLoadsProfile:
+    """Copy a profile and its devices without the recursion of a deep copy.
+
+    Devices only hold an ID and plain strings, so a shallow copy of each one is enough
+    to keep the stored profile independent from the callers.
+    """
+    return replace(profile, devices={device_id: replace(device) for device_id, device in profile.devices.items()})
+
+
 # Simple In-Memory implementation for testing and basic use
 
 
@@ -34,13 +56,13 @@ class InMemoryHomeLoadsProfileRepository(HomeLoadsProfileRepository):
     """In-Memory implementation for the Home Loads Profile Repository."""
 
     def __init__(self, initial_profile: Optional[HomeLoadsProfile] = None):
-        self._profile: Optional[HomeLoadsProfile] = copy.deepcopy(initial_profile)
+        self._profile: Optional[HomeLoadsProfile] = _copy_profile(initial_profile) if initial_profile else None
 
     def get_profile(self) -> Optional[HomeLoadsProfile]:
-        return copy.deepcopy(self._profile)
+        return _copy_profile(self._profile) if self._profile else None
 
     def save_profile(self, profile: HomeLoadsProfile) -> None:
-        self._profile = copy.deepcopy(profile)
+        self._profile = _copy_profile(profile)
 
 
 class SqliteHomeLoadsProfileRepository(HomeLoadsProfileRepository):
@@ -49,10 +71,16 @@ class SqliteHomeLoadsProfileRepository(HomeLoadsProfileRepository):
     # fixed UUID for the default profile
     _DEFAULT_PROFILE_UUID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
+    _SQL_GET_PROFILE = "SELECT id, name, devices_json FROM home_profiles WHERE id = ?"
+    _SQL_SAVE_PROFILE = "INSERT OR REPLACE INTO home_profiles (id, name, devices_json) VALUES (?, ?, ?)"
+
     def __init__(self, db: BaseSqliteRepository):
         self._db = db
         self.logger = db.logger
 
+        # Write-through copy of the stored profile, guarded by the shared connection lock
+        self._cache: Optional[HomeLoadsProfile] = None
+
         self._create_tables()
 
     def _create_tables(self):
@@ -87,111 +115,150 @@ class SqliteHomeLoadsProfileRepository(HomeLoadsProfileRepository):
     def _device_to_dict(self, device: LoadDevice) -> Dict[str, Any]:
         return {"id": str(device.id), "name": device.name, "type": device.type}
 
-    def _dict_to_device(self, data: Dict[str, Any]) -> LoadDevice:
-        """Convert a dictionary to a LoadDevice."""
-        return LoadDevice(id=EntityId(uuid.UUID(data["id"])), name=data["name"], type=data["type"])
+    def _dict_to_device(self, data: Dict[str, Any], device_id: Optional[EntityId] = None) -> LoadDevice:
+        """Convert a dictionary to a LoadDevice, reusing the device ID when already parsed."""
+        if device_id is None:
+            device_id = EntityId(uuid.UUID(data["id"]))
+        return LoadDevice(id=device_id, name=data["name"], type=data["type"])
 
     def _row_to_profile(self, row: sqlite3.Row) -> Optional[HomeLoadsProfile]:
         """Convert a row to a HomeLoadsProfile."""
         if not row:
             return None
         try:
-            devices_data: Dict = json.loads(row["devices_json"] or "{}")
-            devices = {
-                EntityId(uuid.UUID(id_str)): self._dict_to_device(dev_dict) for id_str, dev_dict in devices_data.items()
-            }
-            return HomeLoadsProfile(id=row["id"], name=row["name"], devices=devices)  # UUID
-        except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
-            self.logger.error(f"Error deserializing HomeLoadsProfile from DB line: {dict(row)}. Error: {e}")
+            profile_id, name, devices_json = row
+            devices_data: Dict = json.loads(devices_json or "{}")
+            devices = {}
+            for id_str, dev_dict in devices_data.items():
+                device_id = EntityId(uuid.UUID(id_str))
+                # The key is the ID of the device, so it is parsed only once
+                devices[device_id] = self._dict_to_device(dev_dict, device_id if dev_dict["id"] == id_str else None)
+            return HomeLoadsProfile(id=profile_id, name=name, devices=devices)  # UUID
+        except (ValueError, KeyError, TypeError) as e:
+            # ValueError also covers json.JSONDecodeError and malformed UUIDs
+            self.logger.error(f"Error deserializing HomeLoadsProfile from DB line: {tuple(row)}. Error: {e}")
             return None
 
     def get_profile(self) -> Optional[HomeLoadsProfile]:
         """Get the home load profile from SQLite."""
         self.logger.debug("Getting home load profile from SQLite.")
-        sql = "SELECT * FROM home_profiles WHERE id = ?"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql, (self._DEFAULT_PROFILE_UUID,))
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_profile(row)
-            else:
-                self.logger.info("No home load profile found in DB, returning None.")
+        with self._db.shared_connection() as conn:
+            if self._cache is not None:
+                return _copy_profile(self._cache)
+            try:
+                row = conn.execute(self._SQL_GET_PROFILE, (self._DEFAULT_PROFILE_UUID,)).fetchone()
+                if row:
+                    self._cache = self._row_to_profile(row)
+                    return _copy_profile(self._cache) if self._cache else None
+                else:
+                    self.logger.info("No home load profile found in DB, returning None.")
+                    return None
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error getting home profile: {e}")
                 return None
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error getting home profile: {e}")
-            return None
-        finally:
-            if conn:
-                conn.close()
 
     def save_profile(self, profile: HomeLoadsProfile) -> None:
         """Save the home load profile to SQLite."""
         self.logger.debug(f"Saving home load profile '{profile.name}' to SQLite.")
-        sql = "INSERT OR REPLACE INTO home_profiles (id, name, devices_json) VALUES (?, ?, ?)"
-        conn = self._db.get_connection()
-        try:
-            # Serialize the dictionary of devices
-            devices_json = json.dumps({str(id): self._device_to_dict(dev) for id, dev in profile.devices.items()})
-            with conn:
-                # Always use the fixed UUID for the default profile
-                # default
-                conn.execute(
-                    sql,
-                    (self._DEFAULT_PROFILE_UUID, profile.name, devices_json),
-                )
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error saving home profile: {e}")
-            raise ConfigurationError(f"DB error saving home profile: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            cached = self._cache
+            # Only the name and the devices are stored, the profile always uses the fixed UUID
+            if cached is not None and cached.name == profile.name and cached.devices == profile.devices:
+                self.logger.debug("Home load profile unchanged, skipping the write.")
+                return
+            try:
+                # Serialize the dictionary of devices
+                devices_json = json.dumps({str(id): self._device_to_dict(dev) for id, dev in profile.devices.items()})
+                with conn:
+                    # Always use the fixed UUID for the default profile
+                    # default
+                    conn.execute(
+                        self._SQL_SAVE_PROFILE,
+                        (self._DEFAULT_PROFILE_UUID, profile.name, devices_json),
+                    )
+                self._cache = _copy_profile(profile)
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error saving home profile: {e}")
+                raise ConfigurationError(f"DB error saving home profile: {e}") from e
+
+    def reload(self) -> None:
+        """Drop the cached profile so the next read goes to the database."""
+        with self._db.shared_connection():
+            self._cache = None
 
 
 class InMemoryHomeForecastProviderRepository(HomeForecastProviderRepository):
     """In-memory implementation of HomeForecastProviderRepository for testing purposes."""
 
     def __init__(self):
-        self._home_forecast_providers: List[HomeForecastProvider] = []
+        self._home_forecast_providers: Dict[EntityId, HomeForecastProvider] = {}
+        # Home forecast provider IDs indexed by the external service they use. The indexed
+        # external service of each provider is kept too, since entities can be updated in place.
+        self._by_external_service: Dict[EntityId, Set[EntityId]] = defaultdict(set)
+        self._indexed_external_service: Dict[EntityId, EntityId] = {}
+
+    def _index(self, home_forecast_provider: HomeForecastProvider) -> None:
+        if home_forecast_provider.external_service_id:
+            self._by_external_service[home_forecast_provider.external_service_id].add(home_forecast_provider.id)
+            self._indexed_external_service[home_forecast_provider.id] = home_forecast_provider.external_service_id
+
+    def _unindex(self, home_forecast_provider_id: EntityId) -> None:
+        external_service_id = self._indexed_external_service.pop(home_forecast_provider_id, None)
+        if external_service_id:
+            self._by_external_service[external_service_id].discard(home_forecast_provider_id)
 
     def add(self, home_forecast_provider: HomeForecastProvider) -> None:
-        self._home_forecast_providers.append(home_forecast_provider)
+        self._unindex(home_forecast_provider.id)
+        self._home_forecast_providers[home_forecast_provider.id] = home_forecast_provider
+        self._index(home_forecast_provider)
 
     def get_by_id(self, home_forecast_provider_id: EntityId) -> Optional[HomeForecastProvider]:
-        for home_forecast_provider in self._home_forecast_providers:
-            if home_forecast_provider.id == home_forecast_provider_id:
-                return home_forecast_provider
-        return None
+        return self._home_forecast_providers.get(home_forecast_provider_id)
 
     def get_all(self) -> List[HomeForecastProvider]:
-        return self._home_forecast_providers
+        return list(self._home_forecast_providers.values())
 
     def update(self, home_forecast_provider: HomeForecastProvider) -> None:
-        for i, existing_home_forecast_provider in enumerate(self._home_forecast_providers):
-            if existing_home_forecast_provider.id == home_forecast_provider.id:
-                self._home_forecast_providers[i] = home_forecast_provider
-                return
+        if home_forecast_provider.id not in self._home_forecast_providers:
+            return
+        self._unindex(home_forecast_provider.id)
+        self._home_forecast_providers[home_forecast_provider.id] = home_forecast_provider
+        self._index(home_forecast_provider)
 
     def remove(self, home_forecast_provider_id: EntityId) -> None:
-        self._home_forecast_providers = [n for n in self._home_forecast_providers if n.id != home_forecast_provider_id]
+        self._home_forecast_providers.pop(home_forecast_provider_id, None)
+        self._unindex(home_forecast_provider_id)
 
     def get_by_external_service_id(self, external_service_id: EntityId) -> List[HomeForecastProvider]:
         """Retrieve all home forecast providers linked to a specific external service."""
-        return (
-            [
-                provider
-                for provider in self._home_forecast_providers
-                if provider.external_service_id == external_service_id
-            ]
-            if external_service_id
-            else []
-        )
+        if not external_service_id:
+            return []
+        return [
+            self._home_forecast_providers[home_forecast_provider_id]
+            for home_forecast_provider_id in self._by_external_service.get(external_service_id, ())
+        ]
 
 
 class SqliteHomeForecastProviderRepository(HomeForecastProviderRepository):
     """SQLite implementation of HomeForecastProviderRepository."""
 
+    _SQL_INSERT = """
+        INSERT INTO home_forecast_providers (id, name, adapter_type, config, external_service_id)
+        VALUES (?, ?, ?, ?, ?);
+    """
+    # Columns in the order unpacked by _row_to_home_forecast_provider
+    _COLUMNS = "id, name, adapter_type, config, external_service_id"
+
+    _SQL_GET_BY_ID = f"SELECT {_COLUMNS} FROM home_forecast_providers WHERE id = ?;"
+    _SQL_GET_ALL = f"SELECT {_COLUMNS} FROM home_forecast_providers;"
+    _SQL_UPDATE = """
+        UPDATE home_forecast_providers
+        SET name = ?, adapter_type = ?, config = ?, external_service_id = ?
+        WHERE id = ?;
+    """
+    _SQL_DELETE = "DELETE FROM home_forecast_providers WHERE id = ?;"
+    _SQL_GET_BY_EXTERNAL_SERVICE_ID = f"SELECT {_COLUMNS} FROM home_forecast_providers WHERE external_service_id = ?;"
+
     def __init__(self, db: BaseSqliteRepository):
         self._db = db
         self.logger = db.logger
@@ -213,7 +280,12 @@ class SqliteHomeForecastProviderRepository(HomeForecastProviderRepository):
                 external_service_id TEXT -- Optional ID for external service integration
 
             );
+            """,
             """
+            CREATE INDEX IF NOT EXISTS idx_home_forecast_providers_external_service_id
+            ON home_forecast_providers(external_service_id)
+            WHERE external_service_id IS NOT NULL;
+            """,
         ]
         conn = self._db.get_connection()
         try:
@@ -234,21 +306,15 @@ class SqliteHomeForecastProviderRepository(HomeForecastProviderRepository):
         self, adapter_type: HomeForecastProviderAdapter, config_json: str
     ) -> HomeForecastProviderConfig:
         """Deserialize a JSON string into HomeForecastProviderConfig object."""
-        data: dict = json.loads(config_json)
-
-        if adapter_type not in HOME_FORECAST_PROVIDER_CONFIG_TYPE_MAP:
-            raise HomeForecastProviderNotFoundError(
-                f"Error reading HomeForecastProvider configuration. Invalid type '{adapter_type}'"
-            )
-
         config_class: Optional[type[HomeForecastProviderConfig]] = HOME_FORECAST_PROVIDER_CONFIG_TYPE_MAP.get(
             adapter_type
         )
         if not config_class:
             raise HomeForecastProviderNotFoundError(
-                f"Error creating HomeForecastProviderConfig configuration. Type '{adapter_type}'"
+                f"Error reading HomeForecastProvider configuration. Invalid type '{adapter_type}'"
             )
 
+        data: dict = _load_config_json(config_json)
         config_instance = config_class.from_dict(data)
         if not isinstance(config_instance, HomeForecastProviderConfig):
             raise HomeForecastProviderConfigurationError(
@@ -261,158 +327,130 @@ class SqliteHomeForecastProviderRepository(HomeForecastProviderRepository):
         if not row:
             return None
         try:
-            home_forecast_provider_type = HomeForecastProviderAdapter(row["adapter_type"])
+            provider_id, name, adapter_type, config_json, external_service_id = row
+            home_forecast_provider_type = HomeForecastProviderAdapter(adapter_type)
 
             # Deserialize the config from the database row
-            config = self._deserialize_config(home_forecast_provider_type, row["config"])
+            config = self._deserialize_config(home_forecast_provider_type, config_json)
 
             return HomeForecastProvider(
-                id=EntityId(row["id"]),
-                name=row["name"],
+                id=EntityId(provider_id),
+                name=name,
                 adapter_type=home_forecast_provider_type,
                 config=config,
-                external_service_id=(EntityId(row["external_service_id"]) if row["external_service_id"] else None),
+                external_service_id=(EntityId(external_service_id) if external_service_id else None),
             )
         except (ValueError, KeyError) as e:
-            self.logger.error(f"Error deserializing HomeForecastProvider from DB row: {row}. Error: {e}")
+            self.logger.error(f"Error deserializing HomeForecastProvider from DB row: {tuple(row)}. Error: {e}")
             return None
 
+    def _rows_to_home_forecast_providers(self, rows: Iterable[sqlite3.Row]) -> List[HomeForecastProvider]:
+        """Deserialize the rows streamed from a cursor, skipping the invalid ones."""
+        return [
+            home_forecast_provider
+            for home_forecast_provider in map(self._row_to_home_forecast_provider, rows)
+            if home_forecast_provider is not None
+        ]
+
     def add(self, home_forecast_provider: HomeForecastProvider) -> None:
         """Add a new home forecast provider to the repository."""
         self.logger.debug(f"Adding forecast provider {home_forecast_provider.id} to SQLite repository.")
-        sql = """
-            INSERT INTO home_forecast_providers (id, name, adapter_type, config, external_service_id)
-            VALUES (?, ?, ?, ?, ?);
-        """
-        conn = self._db.get_connection()
-        try:
-            # Serialize config to JSON for storage
-            config_json: str = ""
-            if home_forecast_provider.config:
-                config_json = json.dumps(home_forecast_provider.config.to_dict())
-
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    sql,
-                    (
-                        home_forecast_provider.id,
-                        home_forecast_provider.name,
-                        home_forecast_provider.adapter_type.value,
-                        config_json,
-                        home_forecast_provider.external_service_id,
-                    ),
-                )
-        except sqlite3.IntegrityError as e:
-            self.logger.error(f"Integrity error adding home forecast provider {home_forecast_provider.id}: {e}")
-            # Could mean that the ID already exists
-            raise HomeForecastProviderAlreadyExistsError(
-                f"Home forecast provider with ID {home_forecast_provider.id} "
-                f"already exists or constraint violation: {e}"
-            ) from e
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error adding home forecast provider {home_forecast_provider.id}: {e}")
-            raise HomeForecastProviderError(f"DB error adding home forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                # Serialize config to JSON for storage
+                config_json: str = ""
+                if home_forecast_provider.config:
+                    config_json = json.dumps(home_forecast_provider.config.to_dict())
+
+                with conn:
+                    conn.execute(
+                        self._SQL_INSERT,
+                        (
+                            home_forecast_provider.id,
+                            home_forecast_provider.name,
+                            home_forecast_provider.adapter_type.value,
+                            config_json,
+                            home_forecast_provider.external_service_id,
+                        ),
+                    )
+            except sqlite3.IntegrityError as e:
+                self.logger.error(f"Integrity error adding home forecast provider {home_forecast_provider.id}: {e}")
+                # Could mean that the ID already exists
+                raise HomeForecastProviderAlreadyExistsError(
+                    f"Home forecast provider with ID {home_forecast_provider.id} "
+                    f"already exists or constraint violation: {e}"
+                ) from e
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error adding home forecast provider {home_forecast_provider.id}: {e}")
+                raise HomeForecastProviderError(f"DB error adding home forecast provider: {e}") from e
 
     def get_by_id(self, home_forecast_provider_id: EntityId) -> Optional[HomeForecastProvider]:
         """Retrieve an home forecast provider by its ID."""
         self.logger.debug(f"Retrieving home forecast provider {home_forecast_provider_id} from SQLite repository.")
-        sql = "SELECT * FROM home_forecast_providers WHERE id = ?;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql, (home_forecast_provider_id,))
-            row = cursor.fetchone()
-            return self._row_to_home_forecast_provider(row)
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error retrieving home forecast provider {home_forecast_provider_id}: {e}")
-            raise HomeForecastProviderNotFoundError(f"DB error retrieving home forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                row = conn.execute(self._SQL_GET_BY_ID, (home_forecast_provider_id,)).fetchone()
+                return self._row_to_home_forecast_provider(row)
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error retrieving home forecast provider {home_forecast_provider_id}: {e}")
+                raise HomeForecastProviderNotFoundError(f"DB error retrieving home forecast provider: {e}") from e
 
     def get_all(self) -> List[HomeForecastProvider]:
         """Retrieve all home forecast providers from the repository."""
         self.logger.debug("Retrieving all home forecast providers from SQLite repository.")
-        sql = "SELECT * FROM home_forecast_providers;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql)
-            rows = cursor.fetchall()
-            home_forecast_providers = []
-            for row in rows:
-                home_forecast_provider = self._row_to_home_forecast_provider(row)
-                if home_forecast_provider:
-                    home_forecast_providers.append(home_forecast_provider)
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error retrieving all home forecast providers: {e}")
-            return []
-        finally:
-            if conn:
-                conn.close()
-        return home_forecast_providers
+        with self._db.shared_connection() as conn:
+            try:
+                cursor = conn.execute(self._SQL_GET_ALL)
+                return self._rows_to_home_forecast_providers(cursor)
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error retrieving all home forecast providers: {e}")
+                return []
 
     def update(self, home_forecast_provider: HomeForecastProvider) -> None:
         """Update an existing home forecast provider in the repository."""
         self.logger.debug(f"Updating home forecast provider {home_forecast_provider.id} in SQLite repository.")
-        sql = """
-            UPDATE home_forecast_providers
-            SET name = ?, adapter_type = ?, config = ?, external_service_id = ?
-            WHERE id = ?;
-        """
-        conn = self._db.get_connection()
-        try:
-            # Serialize config to JSON for storage
-            config_json = json.dumps(home_forecast_provider.config)
-
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    sql,
-                    (
-                        home_forecast_provider.name,
-                        home_forecast_provider.adapter_type.value,
-                        config_json,
-                        home_forecast_provider.external_service_id,
-                        home_forecast_provider.id,
-                    ),
-                )
-                if cursor.rowcount == 0:
-                    raise HomeForecastProviderNotFoundError(
-                        f"Home Forecast Provider with ID {home_forecast_provider.id} not found."
+        with self._db.shared_connection() as conn:
+            try:
+                # Serialize config to JSON for storage
+                config_json: str = ""
+                if home_forecast_provider.config:
+                    config_json = json.dumps(home_forecast_provider.config.to_dict())
+
+                with conn:
+                    cursor = conn.execute(
+                        self._SQL_UPDATE,
+                        (
+                            home_forecast_provider.name,
+                            home_forecast_provider.adapter_type.value,
+                            config_json,
+                            home_forecast_provider.external_service_id,
+                            home_forecast_provider.id,
+                        ),
                     )
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error updating home forecast provider {home_forecast_provider.id}: {e}")
-            raise HomeForecastProviderError(f"DB error updating home forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+                    if cursor.rowcount == 0:
+                        raise HomeForecastProviderNotFoundError(
+                            f"Home Forecast Provider with ID {home_forecast_provider.id} not found."
+                        )
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error updating home forecast provider {home_forecast_provider.id}: {e}")
+                raise HomeForecastProviderError(f"DB error updating home forecast provider: {e}") from e
 
     def remove(self, home_forecast_provider_id: EntityId) -> None:
         """Remove an home forecast provider from the repository."""
         self.logger.debug(f"Removing forecast provider {home_forecast_provider_id} from SQLite repository.")
-        sql = "DELETE FROM home_forecast_providers WHERE id = ?;"
-        conn = self._db.get_connection()
-        try:
-            with conn:
-                cursor = conn.cursor()
-                cursor.execute(sql, (home_forecast_provider_id,))
-                if cursor.rowcount == 0:
-                    self.logger.warning(
-                        f"Attempted to remove non-existent home forecast provider {home_forecast_provider_id}."
-                    )
-                    # There is no need to raise an exception here, removing a
-                    # non-existent is idempotent.
-        except sqlite3.Error as e:
-            self.logger.error(f"SQLite error removing home forecast provider {home_forecast_provider_id}: {e}")
-            raise HomeForecastProviderError(f"DB error removing home forecast provider: {e}") from e
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                with conn:
+                    cursor = conn.execute(self._SQL_DELETE, (home_forecast_provider_id,))
+                    if cursor.rowcount == 0:
+                        self.logger.warning(
+                            f"Attempted to remove non-existent home forecast provider {home_forecast_provider_id}."
+                        )
+                        # There is no need to raise an exception here, removing a
+                        # non-existent is idempotent.
+            except sqlite3.Error as e:
+                self.logger.error(f"SQLite error removing home forecast provider {home_forecast_provider_id}: {e}")
+                raise HomeForecastProviderError(f"DB error removing home forecast provider: {e}") from e
 
     def get_by_external_service_id(self, external_service_id: EntityId) -> List[HomeForecastProvider]:
         """Retrieve all home forecast providers linked to a specific external service."""
@@ -420,23 +458,12 @@ class SqliteHomeForecastProviderRepository(HomeForecastProviderRepository):
             "Retrieving home forecast providers linked to external service "
             f"{external_service_id} from SQLite repository."
         )
-        sql = "SELECT * FROM home_forecast_providers WHERE external_service_id = ?;"
-        conn = self._db.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(sql, (external_service_id,))
-            rows = cursor.fetchall()
-            home_forecast_providers = []
-            for row in rows:
-                home_forecast_provider = self._row_to_home_forecast_provider(row)
-                if home_forecast_provider:
-                    home_forecast_providers.append(home_forecast_provider)
-            return home_forecast_providers
-        except sqlite3.Error as e:
-            self.logger.error(
-                f"SQLite error retrieving home forecast providers by external service ID {external_service_id}: {e}"
-            )
-            return []
-        finally:
-            if conn:
-                conn.close()
+        with self._db.shared_connection() as conn:
+            try:
+                cursor = conn.execute(self._SQL_GET_BY_EXTERNAL_SERVICE_ID, (external_service_id,))
+                return self._rows_to_home_forecast_providers(cursor)
+            except sqlite3.Error as e:
+                self.logger.error(
+                    f"SQLite error retrieving home forecast providers by external service ID {external_service_id}: {e}"
+                )
+                return []
@@ -24,6 +24,58 @@ from edge_mining.shared.external_services.entities import ExternalService
 from edge_mining.shared.interfaces.config import MinerControllerConfig
 from edge_mining.shared.logging.port import LoggerPort
 
+# Static menu texts, styled once at import time
+_MINER_MENU_BODY = "\n".join(
+    [
+        "\n" + click.style("--- MINER ---", fg="blue", bold=True),
+        "1. Add a Miner",
+        "2. List all Miners",
+        "3. Manage a Miner",
+        "",
+        "4. Add a Miner Controller",
+        "5. List Miner Controllers",
+        "6. Manage a Miner Controller",
+        "",
+        "b. Back to main menu",
+        "q. Close application",
+        "-----------------",
+    ]
+)
+_MANAGE_MINER_BANNER = "\n" + click.style("--- MANAGE MINER ---", fg="blue", bold=True)
+_MANAGE_MINER_BODY = "\n".join(
+    [
+        "1. Activate Miner",
+        "2. Deactivate Miner",
+        "3. Update Miner",
+        "4. Set Miner Controller",
+        "5. Delete Miner",
+        "",
+        "b. Back to miner menu",
+        "q. Close application",
+        "-----------------",
+    ]
+)
+_MANAGE_CONTROLLER_BANNER = "\n" + click.style("--- MANAGE MINER CONTROLLER ---", fg="blue", bold=True)
+_MANAGE_CONTROLLER_BODY = "\n".join(
+    [
+        "1. Update Controller",
+        "2. Delete Controller",
+        "",
+        "b. Back to miner menu",
+        "q. Close application",
+        "-----------------",
+    ]
+)
+
+
+def _render_controller(controller: MinerController, prefix: str) -> str:
+    """Render a miner controller as a single styled line of a list."""
+    return (
+        f"{prefix}Name: {click.style(f'{controller.name}, ', fg='blue')}"
+        f"ID: {click.style(f'{controller.id}, ', fg='yellow')}"
+        f"Type: {click.style(f'{controller.adapter_type.name}', fg='green')}"
+    )
+
 
 def handle_add_miner(configuration_service: ConfigurationServiceInterface, logger: LoggerPort) -> None:
     """Menu to add a new miner."""
@@ -106,9 +158,11 @@ def list_miners(configuration_service: ConfigurationServiceInterface):
     if not miners:
         click.echo(click.style("No miner configured.", fg="yellow"))
     else:
+        # Build the whole list and write it at once
+        lines = []
         for m in miners:
             hashrate_str = f"{m.hash_rate_max.value} {m.hash_rate_max.unit}" if m.hash_rate_max else "N/A"
-            click.echo(
+            lines.append(
                 "-> "
                 + "Name: "
                 + click.style(f"{m.name}, ", fg="blue")
@@ -129,6 +183,7 @@ def list_miners(configuration_service: ConfigurationServiceInterface):
                 + "Active: "
                 + click.style(f"{m.active}", fg="green" if m.active else "red")
             )
+        click.echo("\n".join(lines))
     click.echo("")
 
 
@@ -155,9 +210,10 @@ def select_miner(
         return None
 
     default_idx = ""
+    lines = []
     for idx, m in enumerate(miners):
         hashrate_str = f"{m.hash_rate_max.value} {m.hash_rate_max.unit}" if m.hash_rate_max else "N/A"
-        click.echo(
+        lines.append(
             f"{idx}. "
             + "Name: "
             + click.style(f"{m.name}, ", fg="blue")
@@ -175,7 +231,8 @@ def select_miner(
             if m.id == default_id:
                 default_idx = str(idx)
 
-    click.echo("\nb. Back to menu\n")
+    lines.append("\nb. Back to menu\n")
+    click.echo("\n".join(lines))
 
     miner_idx: str = click.prompt("Choose a Miner index", type=str, default=default_idx)
     miner_idx = miner_idx.strip().lower()
@@ -346,26 +403,25 @@ def print_miner_details(
     configuration_service: ConfigurationServiceInterface,
 ) -> None:
     """Print details of a selected miner."""
-    click.echo("")
-    click.echo("| Name: " + click.style(miner.name, fg="blue"))
-    click.echo("| ID: " + click.style(miner.id, fg="yellow"))
-    click.echo(
+    lines = [
+        "",
+        "| Name: " + click.style(miner.name, fg="blue"),
+        "| ID: " + click.style(miner.id, fg="yellow"),
         "| Status: "
         + click.style(
             miner.status.name,
             fg="green" if miner.status == MinerStatus.ON else "red",
-        )
-    )
-    click.echo(
+        ),
         "| Max HashRate: " + str(miner.hash_rate_max.value)
         if miner.hash_rate_max
         else "N/A" + " " + miner.hash_rate_max.unit
         if miner.hash_rate_max
-        else "N/A"
-    )
-    click.echo("| Max Power Consumption: " + str(miner.power_consumption_max) + " W")
-    click.echo("| Active: " + click.style(miner.active, fg="green" if miner.active else "red"))
-    click.echo("| Controller ID: " + (str(miner.controller_id) if miner.controller_id else "None"))
+        else "N/A",
+        "| Max Power Consumption: " + str(miner.power_consumption_max) + " W",
+        "| Active: " + click.style(miner.active, fg="green" if miner.active else "red"),
+        "| Controller ID: " + (str(miner.controller_id) if miner.controller_id else "None"),
+    ]
+    click.echo("\n".join(lines))
 
     if miner.controller_id:
         controller = configuration_service.get_miner_controller(miner.controller_id)
@@ -386,19 +442,11 @@ def manage_single_miner_menu(
 ) -> str:
     """Menu for managing a specific Miner."""
     while True:
-        click.echo("\n" + click.style("--- MANAGE MINER ---", fg="blue", bold=True))
+        click.echo(_MANAGE_MINER_BANNER)
 
         print_miner_details(miner, configuration_service)
 
-        click.echo("1. Activate Miner")
-        click.echo("2. Deactivate Miner")
-        click.echo("3. Update Miner")
-        click.echo("4. Set Miner Controller")
-        click.echo("5. Delete Miner")
-        click.echo("")
-        click.echo("b. Back to miner menu")
-        click.echo("q. Close application")
-        click.echo("-----------------")
+        click.echo(_MANAGE_MINER_BODY)
 
         choice: str = click.prompt("Choose an option", type=str)
         choice = choice.strip().lower()
@@ -663,16 +711,8 @@ def handle_list_miner_controllers(configuration_service: ConfigurationServiceInt
     if not controllers:
         click.echo(click.style("No miner controllers configured.", fg="yellow"))
     else:
-        for c in controllers:
-            click.echo(
-                "-> "
-                + "Name: "
-                + click.style(f"{c.name}, ", fg="blue")
-                + "ID: "
-                + click.style(f"{c.id}, ", fg="yellow")
-                + "Type: "
-                + click.style(f"{c.adapter_type.name}", fg="green")
-            )
+        # Build the whole list and write it at once
+        click.echo("\n".join(_render_controller(c, "-> ") for c in controllers))
     click.echo("")
     click.pause("Press any key to return to the menu...")
 
@@ -684,10 +724,16 @@ def print_miner_controller_details(
     show_external_service: bool = False,
 ) -> None:
     """Print details of a selected Miner Controller."""
-    click.echo("")
-    click.echo("| Name: " + click.style(controller.name, fg="blue"))
-    click.echo("| ID: " + click.style(controller.id, fg="yellow"))
-    click.echo("| Adapter Type: " + click.style(controller.adapter_type.name, fg="green"))
+    click.echo(
+        "\n".join(
+            [
+                "",
+                "| Name: " + click.style(controller.name, fg="blue"),
+                "| ID: " + click.style(controller.id, fg="yellow"),
+                "| Adapter Type: " + click.style(controller.adapter_type.name, fg="green"),
+            ]
+        )
+    )
     print_miner_controller_config(controller)
     click.echo("")
 
@@ -715,9 +761,9 @@ def print_miner_controller_details(
         if not miners:
             click.echo(click.style("No miners assigned to this controller.", fg="yellow"))
         else:
-            click.echo("Miners assigned to this controller:")
+            lines = ["Miners assigned to this controller:"]
             for m in miners:
-                click.echo(
+                lines.append(
                     "-> "
                     + "Name: "
                     + click.style(f"{m.name}, ", fg="blue")
@@ -726,7 +772,8 @@ def print_miner_controller_details(
                     + "Type: "
                     + click.style(f"{m.power_consumption_max}", fg="green")
                 )
-            click.echo("")
+            lines.append("")
+            click.echo("\n".join(lines))
 
 
 def print_miner_controller_config(controller: MinerController) -> None:
@@ -809,18 +856,13 @@ def manage_single_miner_controller_menu(
 ) -> str:
     """Menu for managing a specific Miner Controller."""
     while True:
-        click.echo("\n" + click.style("--- MANAGE MINER CONTROLLER ---", fg="blue", bold=True))
+        click.echo(_MANAGE_CONTROLLER_BANNER)
 
         print_miner_controller_details(
             controller, configuration_service, show_miner_list=True, show_external_service=True
         )
 
-        click.echo("1. Update Controller")
-        click.echo("2. Delete Controller")
-        click.echo("")
-        click.echo("b. Back to miner menu")
-        click.echo("q. Close application")
-        click.echo("-----------------")
+        click.echo(_MANAGE_CONTROLLER_BODY)
 
         choice: str = click.prompt("Choose an option", type=str, default="")
         choice = choice.strip().lower()
@@ -883,22 +925,12 @@ def select_miner_controller(
         controllers = [c for c in controllers if c.adapter_type in filter_type]
 
     default_idx = ""
-    for idx, c in enumerate(controllers):
-        click.echo(
-            f"{idx}. "
-            + "Name: "
-            + click.style(f"{c.name}, ", fg="blue")
-            + "ID: "
-            + click.style(f"{c.id}, ", fg="yellow")
-            + "Type: "
-            + click.style(f"{c.adapter_type.name}", fg="green")
-        )
+    if default_id:
+        default_idx = str(next((idx for idx, c in enumerate(controllers) if c.id == default_id), ""))
 
-        if default_id:
-            if c.id == default_id:
-                default_idx = str(idx)
-
-    click.echo("\nb. Back to menu\n")
+    lines = [_render_controller(c, f"{idx}. ") for idx, c in enumerate(controllers)]
+    lines.append("\nb. Back to menu\n")
+    click.echo("\n".join(lines))
 
     controller_idx: str = click.prompt("Choose a Controller index", type=str, default=default_idx)
     controller_idx = controller_idx.strip().lower()
@@ -933,18 +965,7 @@ def handle_manage_miner_controller(configuration_service: ConfigurationServiceIn
 def miner_menu(configuration_service: ConfigurationServiceInterface, logger: LoggerPort) -> str:
     """Menu for managing Miners."""
     while True:
-        click.echo("\n" + click.style("--- MINER ---", fg="blue", bold=True))
-        click.echo("1. Add a Miner")
-        click.echo("2. List all Miners")
-        click.echo("3. Manage a Miner")
-        click.echo("")
-        click.echo("4. Add a Miner Controller")
-        click.echo("5. List Miner Controllers")
-        click.echo("6. Manage a Miner Controller")
-        click.echo("")
-        click.echo("b. Back to main menu")
-        click.echo("q. Close application")
-        click.echo("-----------------")
+        click.echo(_MINER_MENU_BODY)
 
         choice: str = click.prompt("Choose an option", type=str)
         choice = choice.strip().lower()
@@ -50,8 +50,11 @@ def handle_external_service_home_assistant_api_config() -> Optional[ExternalServ
 
     url: str = click.prompt("Home Assistant URL", type=str)
     token: str = click.prompt("Long-Lived Access Token", type=str)
+    state_cache_ttl_seconds: float = click.prompt(
+        "Entity state cache TTL in seconds (0 to disable)", type=click.FloatRange(min=0), default=5.0
+    )
 
-    return ExternalServiceHomeAssistantConfig(url=url, token=token)
+    return ExternalServiceHomeAssistantConfig(url=url, token=token, state_cache_ttl_seconds=state_cache_ttl_seconds)
 
 
 def handle_external_service_configuration(
@@ -188,6 +188,9 @@ class ExternalServiceHomeAssistantConfigSchema(BaseModel):
 
     url: str = Field(..., description="URL of the Home Assistant instance")
     token: str = Field(..., description="Long-lived access token for Home Assistant API")
+    state_cache_ttl_seconds: float = Field(
+        default=5.0, ge=0, description="Seconds an entity state is reused, 0 disables the cache"
+    )
 
     @field_validator("url")
     @classmethod
@@ -215,6 +218,7 @@ class ExternalServiceHomeAssistantConfigSchema(BaseModel):
         return ExternalServiceHomeAssistantConfig(
             url=self.url,
             token=self.token,
+            state_cache_ttl_seconds=self.state_cache_ttl_seconds,
         )
 
     @classmethod
@@ -225,6 +229,7 @@ class ExternalServiceHomeAssistantConfigSchema(BaseModel):
         return cls(
             url=config.url,
             token=config.token,
+            state_cache_ttl_seconds=config.state_cache_ttl_seconds,
         )
 
     class Config:
@@ -12,12 +12,16 @@ https://github.com/home-assistant/developers.home-assistant/pull/2150
 """
 
 import math  # For isnan
+import threading
 import time
-from typing import Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 from homeassistant_api import Client, Domain, Entity, Service
 
 from edge_mining.adapters.infrastructure.homeassistant.utils import (
+    ENERGY_UNIT_MULTIPLIERS,
+    POWER_UNIT_MULTIPLIERS,
     STATE_SERVICE_MAP,
     SWITCH_STATE_MAP,
     SwitchDomain,
@@ -37,6 +41,11 @@ from edge_mining.shared.interfaces.config import ExternalServiceConfig
 from edge_mining.shared.interfaces.factories import ExternalServiceFactory
 from edge_mining.shared.logging.port import LoggerPort
 
+# Default seconds an entity state is reused, adapters polling the same entity share one request
+STATE_CACHE_TTL_SECONDS = 5.0
+# Maximum number of entity states kept, the least recently used are discarded
+STATE_CACHE_MAX_SIZE = 100
+
 
 class ServiceHomeAssistantAPI(ExternalServicePort):
     """
@@ -45,7 +54,13 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
     Requires careful configuration of HA parameters in the .env file.
     """
 
-    def __init__(self, api_url: str, token: str, logger: Optional[LoggerPort]):
+    def __init__(
+        self,
+        api_url: str,
+        token: str,
+        logger: Optional[LoggerPort],
+        state_cache_ttl_seconds: float = STATE_CACHE_TTL_SECONDS,
+    ):
         super().__init__(external_service_type=ExternalServiceAdapter.HOME_ASSISTANT_API)
         self.logger = logger
 
@@ -60,6 +75,11 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
 
         self.client: Optional[Client] = None
 
+        # Recently fetched entity states, with the monotonic time they were fetched at
+        self.state_cache_ttl_seconds = state_cache_ttl_seconds
+        self._state_cache: OrderedDict[str, Tuple[float, Tuple[Optional[str], Optional[str]]]] = OrderedDict()
+        self._state_cache_lock = threading.Lock()
+
         self.connect()  # Connect to the API during initialization
 
     def connect(self) -> None:
@@ -69,7 +89,9 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
 
         # Initialize Home Assistant client
         try:
-            self.client = Client(self.api_url, self.token)
+            # A plain session keeps the connection alive between requests. The default
+            # one caches responses for minutes, entity states would be stale.
+            self.client = Client(self.api_url, self.token, cache_session=False)
 
             # Test connection during initialization (optional but recommended)
             self.client.get_config()
@@ -85,8 +107,40 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
         if self.logger:
             self.logger.info("Disconnecting from Home Assistant API.")
 
-        # The Client does not have a disconnect method, but we can clear the client
+        # The Client does not have a disconnect method, but we can close its session and clear it
+        if self.client:
+            self.client.cache_session.close()
         self.client = None
+        with self._state_cache_lock:
+            self._state_cache.clear()
+
+    def _cached_state(self, entity_id: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Returns the state and unit of an entity fetched less than the cache TTL ago, if any."""
+        with self._state_cache_lock:
+            cached = self._state_cache.get(entity_id)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] >= self.state_cache_ttl_seconds:
+                del self._state_cache[entity_id]
+                return None
+            self._state_cache.move_to_end(entity_id)
+            return cached[1]
+
+    def _cache_state(self, entity_id: str, state_and_unit: Tuple[Optional[str], Optional[str]]) -> None:
+        """Stores a fetched state and unit, discarding the least recently used ones when full."""
+        if state_and_unit[0] is None or self.state_cache_ttl_seconds <= 0:
+            # Unavailable entities are fetched again on the next request
+            return
+        with self._state_cache_lock:
+            self._state_cache[entity_id] = (time.monotonic(), state_and_unit)
+            self._state_cache.move_to_end(entity_id)
+            while len(self._state_cache) > STATE_CACHE_MAX_SIZE:
+                self._state_cache.popitem(last=False)
+
+    def _invalidate_state(self, entity_id: str) -> None:
+        """Discards the cached state of an entity."""
+        with self._state_cache_lock:
+            self._state_cache.pop(entity_id, None)
 
     def get_entity_state(self, entity_id: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
         """Safely retrieves the state and unit of an entity."""
@@ -96,28 +150,79 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
             if self.logger:
                 self.logger.error("Home Assistant client is not initialized.")
             return None, None
+        cached = self._cached_state(entity_id)
+        if cached is not None:
+            return cached
         try:
             entity: Optional[Entity] = self.client.get_entity(entity_id=entity_id)
             if not entity:
                 if self.logger:
                     self.logger.warning(f"Home Assistant entity '{entity_id}' not found.")
                 return None, None
-            # Check if state is unavailable or unknown
-            state = entity.state.state  # The actual value as a string
-            if state is None or state.lower() in ["unavailable", "unknown"]:
-                if self.logger:
-                    self.logger.warning(f"Home Assistant entity '{entity_id}' is unavailable or unknown.")
-                return None, None
+            state_and_unit = self._state_and_unit(entity_id, entity.state.state, entity.state.attributes)
+            self._cache_state(entity_id, state_and_unit)
+            return state_and_unit
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Unexpected error getting Home Assistant entity '{entity_id}': {e}")
+            return None, None
 
-            unit = entity.state.attributes.get("unit_of_measurement")
+    def get_entity_states(self, entity_ids: Iterable[str]) -> Optional[Dict[str, Tuple[Optional[str], Optional[str]]]]:
+        """
+        Retrieves the state and unit of many entities with a single request.
+        Returns None if the states cannot be listed.
+        """
+        if not self.client:
             if self.logger:
-                self.logger.debug(f"Fetched HA entity '{entity_id}': State='{state}', Unit='{unit}'")
-            return state, unit
+                self.logger.error("Home Assistant client is not initialized.")
+            return None
+        try:
+            all_states = {state.entity_id: state for state in self.client.get_states()}
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Unexpected error getting Home Assistant entity '{entity_id}': {e}")
+                self.logger.error(f"Unexpected error listing Home Assistant entities: {e}")
+            return None
+
+        entity_states: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        for entity_id in entity_ids:
+            state = all_states.get(entity_id)
+            if state is None:
+                if self.logger:
+                    self.logger.warning(f"Home Assistant entity '{entity_id}' not found.")
+                entity_states[entity_id] = (None, None)
+                continue
+            entity_states[entity_id] = self._state_and_unit(entity_id, state.state, state.attributes)
+            self._cache_state(entity_id, entity_states[entity_id])
+        return entity_states
+
+    def _state_and_unit(
+        self, entity_id: str, state: Optional[str], attributes: dict
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Returns the state and unit of an entity, or None if it is unavailable or unknown."""
+        # Check if state is unavailable or unknown
+        if state is None or state.lower() in ["unavailable", "unknown"]:
+            if self.logger:
+                self.logger.warning(f"Home Assistant entity '{entity_id}' is unavailable or unknown.")
             return None, None
 
+        unit = attributes.get("unit_of_measurement")
+        if self.logger:
+            self.logger.debug(f"Fetched HA entity '{entity_id}': State='{state}', Unit='{unit}'")
+        return state, unit
+
+    def get_entity_ids(self) -> Optional[Set[str]]:
+        """Retrieves the IDs of all the entities known by Home Assistant, None if they cannot be listed."""
+        if not self.client:
+            if self.logger:
+                self.logger.error("Home Assistant client is not initialized.")
+            return None
+        try:
+            return {state.entity_id for state in self.client.get_states()}
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Unexpected error listing Home Assistant entities: {e}")
+            return None
+
     def set_entity_state(self, entity_id: Optional[str], state: str) -> bool:
         """Sets the state of an entity."""
         if not entity_id:
@@ -175,6 +280,7 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
             # Due to async nature of HA, we may not get the updated state immediately and this check may fail
             # even if the command was successful, so we need to wait a bit to get the updated state
             time.sleep(1)  # Wait a moment for the state to update
+            self._invalidate_state(entity_id)
             current_state_str, _ = self.get_entity_state(entity_id)
             current_state_str = current_state_str.lower() if current_state_str else ""
             current_state_value: Optional[bool] = SWITCH_STATE_MAP.get(current_state_str, None)
@@ -198,13 +304,43 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
                 self.logger.error(f"Unexpected error setting Home Assistant entity '{entity_id}': {e}")
             return False
 
-    def parse_power(
+    def _unit_multiplier(
         self,
-        state: Optional[str],
         configured_unit: str,
+        multipliers: Dict[str, float],
         entity_id_for_log: str,
-    ) -> Optional[Watts]:
-        """Parses state string to Watts, handling units (W/kW) and errors."""
+        fallback_unit_name: str,
+    ) -> float:
+        """Resolves a configured unit to its multiplier, falling back to 1.0 for unsupported units."""
+        # Units are usually already lowercase, lower them only when needed
+        multiplier = multipliers.get(configured_unit)
+        if multiplier is None:
+            multiplier = multipliers.get(configured_unit.lower())
+        if multiplier is None:
+            if self.logger:
+                self.logger.warning(
+                    f"Unsupported unit '{configured_unit}' "
+                    f"configured for entity '{entity_id_for_log}'. "
+                    f"Assuming {fallback_unit_name}."
+                )
+            return 1.0
+        return multiplier
+
+    def power_unit_multiplier(self, configured_unit: str, entity_id_for_log: str) -> float:
+        """Resolves a power unit (W/kW/MW) to the multiplier converting it to Watts."""
+        return self._unit_multiplier(configured_unit, POWER_UNIT_MULTIPLIERS, entity_id_for_log, "Watts")
+
+    def energy_unit_multiplier(self, configured_unit: str, entity_id_for_log: str) -> float:
+        """Resolves an energy unit (Wh/kWh/MWh) to the multiplier converting it to Watt Hours."""
+        return self._unit_multiplier(configured_unit, ENERGY_UNIT_MULTIPLIERS, entity_id_for_log, "WattHours")
+
+    def parse_scaled(
+        self,
+        state: Optional[str],
+        multiplier: float,
+        entity_id_for_log: str,
+    ) -> Optional[float]:
+        """Parses state string to a float scaled by a pre-resolved multiplier, handling errors."""
         if state is None:
             return None
         try:
@@ -215,24 +351,26 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
                         f"Parsed NaN value for entity '{entity_id_for_log}', state='{state}'. Treating as missing."
                     )
                 return None
-            if configured_unit.lower() == "kw":
-                value *= 1000  # Convert kW to W
-            elif configured_unit.lower() != "w":
-                if self.logger:
-                    self.logger.warning(
-                        f"Unsupported unit '{configured_unit}' "
-                        f"configured for entity '{entity_id_for_log}'. "
-                        f"Assuming Watts."
-                    )
-
-            return Watts(value)
+            return value * multiplier
         except (ValueError, TypeError) as e:
             if self.logger:
-                self.logger.error(
-                    f"Could not parse power value for entity '{entity_id_for_log}' from state='{state}': {e}"
-                )
+                self.logger.error(f"Could not parse value for entity '{entity_id_for_log}' from state='{state}': {e}")
             return None
 
+    def parse_power(
+        self,
+        state: Optional[str],
+        configured_unit: str,
+        entity_id_for_log: str,
+    ) -> Optional[Watts]:
+        """Parses state string to Watts, handling units (W/kW) and errors."""
+        if state is None:
+            return None
+        value = self.parse_scaled(
+            state, self.power_unit_multiplier(configured_unit, entity_id_for_log), entity_id_for_log
+        )
+        return Watts(value) if value is not None else None
+
     def parse_energy(
         self,
         state: Optional[str],
@@ -242,31 +380,10 @@ class ServiceHomeAssistantAPI(ExternalServicePort):
         """Parses state string to Watt Hours, handling units (Wh/kWh) and errors."""
         if state is None:
             return None
-        try:
-            value = float(state)
-            if math.isnan(value):
-                if self.logger:
-                    self.logger.warning(
-                        f"Parsed NaN value for entity '{entity_id_for_log}', state='{state}'. Treating as missing."
-                    )
-                return None
-            if configured_unit.lower() == "kwh":
-                value *= 1000  # Convert kWh to Wh
-            elif configured_unit.lower() != "wh":
-                if self.logger:
-                    self.logger.warning(
-                        f"Unsupported unit '{configured_unit}' "
-                        f"configured for entity '{entity_id_for_log}'. "
-                        f"Assuming WattHours."
-                    )
-
-            return WattHours(value)
-        except (ValueError, TypeError) as e:
-            if self.logger:
-                self.logger.error(
-                    f"Could not parse energy value for entity '{entity_id_for_log}' from state='{state}': {e}"
-                )
-            return None
+        value = self.parse_scaled(
+            state, self.energy_unit_multiplier(configured_unit, entity_id_for_log), entity_id_for_log
+        )
+        return WattHours(value) if value is not None else None
 
     def parse_percentage(self, state: Optional[str], entity_id_for_log: str) -> Optional[Percentage]:
         """Parses state string to Percentage, handling errors."""
@@ -343,4 +460,5 @@ class ServiceHomeAssistantAPIFactory(ExternalServiceFactory):
             api_url=external_service_ha_config.url,
             token=external_service_ha_config.token,
             logger=logger,
+            state_cache_ttl_seconds=external_service_ha_config.state_cache_ttl_seconds,
         )
@@ -36,3 +36,17 @@ SWITCH_STATE_MAP: Dict[str, bool] = {
     "false": False,
     "0": False,
 }
+
+# Multipliers to convert a configured power unit to Watts
+POWER_UNIT_MULTIPLIERS: Dict[str, float] = {
+    "w": 1.0,
+    "kw": 1000.0,
+    "mw": 1000000.0,
+}
+
+# Multipliers to convert a configured energy unit to Watt Hours
+ENERGY_UNIT_MULTIPLIERS: Dict[str, float] = {
+    "wh": 1.0,
+    "kwh": 1000.0,
+    "mwh": 1000000.0,
+}
@@ -51,6 +51,15 @@ class TerminalLogger(LoggerPort):
         """Logs a DEBUG message"""
         self.log(msg, level="DEBUG")
 
+    def is_debug_enabled(self) -> bool:
+        """Tells if DEBUG messages are emitted with the configured level."""
+        if isinstance(self.log_level, int):
+            return self.log_level <= logger.level("DEBUG").no
+        try:
+            return logger.level(self.log_level.upper()).no <= logger.level("DEBUG").no
+        except ValueError:
+            return True
+
     def info(self, msg):
         """Logs an INFO message"""
         self.log(msg, level="INFO")
@@ -4,7 +4,10 @@ It provides a base implementation for creating tables and getting connections to
 """
 
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 from edge_mining.shared.logging.port import LoggerPort
 
@@ -20,15 +23,54 @@ class BaseSqliteRepository:
         self.db_path = db_path
         self.logger = logger
 
-    def get_connection(self):
-        """Obtain a database connection."""
+        # Long-lived connection, used only while holding shared_connection_lock
+        self._shared_connection: Optional[sqlite3.Connection] = None
+        self.shared_connection_lock = threading.RLock()
+        self._wal_enabled = False
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open and configure a new database connection."""
         try:
             # We set a timeout for blocking operations
-            conn = sqlite3.connect(self.db_path, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=10,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                check_same_thread=check_same_thread,
+            )
             conn.row_factory = sqlite3.Row  # Accessing columns by name
             conn.execute("PRAGMA foreign_keys = ON;")  # Enable foreign keys if used
+            # Readers do not block the writer. The journal mode is stored in the
+            # database file, so it is enough to set it on the first connection.
+            if not self._wal_enabled:
+                conn.execute("PRAGMA journal_mode = WAL;")
+                self._wal_enabled = True
+            # With WAL, commits do not need to wait for every fsync to be durable on power loss
+            conn.execute("PRAGMA synchronous = NORMAL;")
 
             return conn
         except sqlite3.Error as e:
             self.logger.error(f"SQLite DB connection error ({self.db_path}): {e}")
             raise ConnectionError(f"SQLite Connection Error: {e}") from e
+
+    def get_connection(self):
+        """Obtain a database connection."""
+        return self._connect()
+
+    def get_shared_connection(self) -> sqlite3.Connection:
+        """
+        Obtain the long-lived database connection, opened on first use.
+        Keeping it open saves connecting on every query and lets SQLite reuse
+        its prepared statements. Callers must hold shared_connection_lock while
+        using it and must not close it.
+        """
+        with self.shared_connection_lock:
+            if self._shared_connection is None:
+                self._shared_connection = self._connect(check_same_thread=False)
+            return self._shared_connection
+
+    @contextmanager
+    def shared_connection(self) -> Iterator[sqlite3.Connection]:
+        """Use the long-lived database connection, holding its lock for the whole block."""
+        with self.shared_connection_lock:
+            yield self.get_shared_connection()
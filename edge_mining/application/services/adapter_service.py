@@ -727,16 +727,29 @@ class AdapterService(AdapterServiceInterface):
                 self.logger.error(f"Failed to create RuleEngine instance: {e}")
             return None
 
+    def _stop_adapter(self, entity_id: EntityId, instance: object) -> None:
+        """Stop the background work of an adapter, if any, before it is dropped from the cache."""
+        stop = getattr(instance, "stop", None)
+        if not callable(stop):
+            return
+        try:
+            stop()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Failed to stop adapter with ID {entity_id}: {e}")
+
     def clear_all_adapters(self):
         """Clear adapter cache"""
         if self.logger:
             self.logger.info("Clearing all adapters.")
+        for entity_id, instance in self._instance_cache.items():
+            self._stop_adapter(entity_id, instance)
         self._instance_cache = {}  # Reset the cache
 
     def remove_adapter(self, entity_id: EntityId):
         """Remove a specific adapter from the cache."""
         if entity_id in self._instance_cache:
-            del self._instance_cache[entity_id]
+            self._stop_adapter(entity_id, self._instance_cache.pop(entity_id))
             if self.logger:
                 self.logger.info(f"Removed adapter with ID {entity_id} from cache.")
         else:
@@ -20,7 +20,8 @@ TimePeriod = Tuple[datetime, datetime]
 class ValueObject:
     """Base class for value objects."""
 
-    pass  # Base class for value objects if needed
+    # No instance dict here, so value objects declared with slots stay dict-free
+    __slots__ = ()
 
 
 @dataclass
@@ -34,7 +35,7 @@ class Entity:
 class AggregateRoot:
     """Base class for aggregate roots."""
 
-    id: EntityId = field(default_factory=EntityId(uuid.uuid4()))
+    id: EntityId = field(default_factory=lambda: EntityId(uuid.uuid4()))
 
 
 class AdapterType(Enum):
@@ -64,7 +64,7 @@ class Sun(ValueObject):
         return datetime.now() - self.sunset
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForecastPowerPoint(ValueObject):
     """Value Object for a single forecast power point."""
 
@@ -72,7 +72,7 @@ class ForecastPowerPoint(ValueObject):
     power: Watts
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ForecastInterval(ValueObject):
     """Value Object for a forecast energy interval."""
 
@@ -50,6 +50,8 @@ class EnergyMonitorHomeAssistantConfig(EnergyMonitorConfig):
     unit_battery_remaining_capacity: str = field(default="Wh")
     grid_positive_export: bool = field(default=False)
     battery_positive_charge: bool = field(default=True)
+    refresh_interval_seconds: int = field(default=0)  # 0 disables the background refresh
+    max_data_age_seconds: int = field(default=120)
 
     def is_valid(self, adapter_type: EnergyMonitorAdapter) -> bool:
         """
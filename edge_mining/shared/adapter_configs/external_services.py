@@ -1,6 +1,6 @@
 """Collection of adapters configuration for the external services of the Edge Mining application."""
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 
 from edge_mining.shared.external_services.common import ExternalServiceAdapter
 from edge_mining.shared.interfaces.config import ExternalServiceConfig
@@ -15,6 +15,7 @@ class ExternalServiceHomeAssistantConfig(ExternalServiceConfig):
 
     url: str
     token: str
+    state_cache_ttl_seconds: float = field(default=5.0)  # 0 disables the entity state cache
 
     def is_valid(self, adapter_type: ExternalServiceAdapter) -> bool:
         """
@@ -4,6 +4,7 @@ of the Edge Mining application.
 """
 
 from dataclasses import asdict, dataclass, field
+from functools import cached_property
 
 from edge_mining.domain.forecast.common import ForecastProviderAdapter
 from edge_mining.shared.interfaces.config import ForecastProviderConfig
@@ -65,6 +66,7 @@ class ForecastProviderHomeAssistantConfig(ForecastProviderConfig):
     unit_forecast_energy_today: str = field(default="kWh")
     unit_forecast_energy_tomorrow: str = field(default="kWh")
     unit_forecast_energy_remaining_today: str = field(default="kWh")
+    cache_ttl_seconds: int = field(default=60)  # 0 disables the forecast cache
 
     def is_valid(self, adapter_type: ForecastProviderAdapter) -> bool:
         """
@@ -73,9 +75,14 @@ class ForecastProviderHomeAssistantConfig(ForecastProviderConfig):
         """
         return adapter_type == ForecastProviderAdapter.HOME_ASSISTANT_API
 
+    @cached_property
+    def _dict(self) -> dict:
+        """Serializable dictionary, built once since the configuration is immutable"""
+        return {**asdict(self)}
+
     def to_dict(self) -> dict:
         """Converts the configuration object into a serializable dictionary"""
-        return {**asdict(self)}
+        return dict(self._dict)
 
     @classmethod
     def from_dict(cls, data: dict):
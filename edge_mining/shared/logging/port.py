@@ -21,6 +21,10 @@ class LoggerPort(ABC):
         """Logs a DEBUG message"""
         raise NotImplementedError
 
+    def is_debug_enabled(self) -> bool:
+        """Tells if DEBUG messages are emitted, to skip building them when not."""
+        return True
+
     @abstractmethod
     def info(self, msg):
         """Logs an INFO message"""
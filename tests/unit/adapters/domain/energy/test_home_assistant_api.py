@@ -0,0 +1,193 @@
+"""Unit tests for HomeAssistantAPIEnergyMonitor adapter."""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from edge_mining.adapters.domain.energy.home_assistant_api import (
+    UNKNOWN_ENTITIES_RECHECK_POLLS,
+    HomeAssistantAPIEnergyMonitorBuilder,
+)
+from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import ServiceHomeAssistantAPI
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class TestHomeAssistantAPIEnergyMonitor(unittest.TestCase):
+    """Test cases for HomeAssistantAPIEnergyMonitor class."""
+
+    def setUp(self):
+        """Set up a Home Assistant service that never touches the network."""
+        self.mock_logger = Mock(spec=LoggerPort)
+        with patch.object(ServiceHomeAssistantAPI, "connect"):
+            self.home_assistant = ServiceHomeAssistantAPI(
+                api_url="http://homeassistant.local:8123", token="token", logger=self.mock_logger
+            )
+        self.entity_states = {
+            "sensor.production": ("2.5", "kW"),
+            "sensor.consumption": ("800", "W"),
+            "sensor.grid": ("-1200", "W"),
+            "sensor.battery_soc": ("75", "%"),
+            "sensor.battery_power": ("500", "W"),
+        }
+        self.home_assistant.get_entity_state = Mock(
+            side_effect=lambda entity_id: self.entity_states.get(entity_id, (None, None))
+        )
+
+    def test_only_configured_entities_are_fetched(self):
+        """Test that unconfigured entities never reach the Home Assistant service."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_production_entity("sensor.production", unit="kW")
+            .set_consumption_entity("sensor.consumption")
+            .build()
+        )
+
+        snapshot = monitor.get_current_energy_state()
+
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 2)
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot.production, 2500.0)
+        self.assertEqual(snapshot.consumption.current_power, 800.0)
+        self.assertIsNone(snapshot.grid)
+        self.assertIsNone(snapshot.battery)
+
+    def test_full_configuration(self):
+        """Test a snapshot with grid and battery entities configured."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_production_entity("sensor.production", unit="kW")
+            .set_consumption_entity("sensor.consumption")
+            .set_grid_entity("sensor.grid", positive_export=True)
+            .set_battery_entities("sensor.battery_soc", "sensor.battery_power")
+            .build()
+        )
+
+        snapshot = monitor.get_current_energy_state()
+
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 5)
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot.grid.current_power, 1200.0)
+        self.assertEqual(snapshot.battery.state_of_charge, 75.0)
+        self.assertEqual(snapshot.battery.current_power, 500.0)
+
+    def test_unsupported_unit_is_reported_once(self):
+        """Test that an unsupported unit is reported at construction and not on every poll."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption", unit="hp")
+            .build()
+        )
+
+        monitor.get_current_energy_state()
+        snapshot = monitor.get_current_energy_state()
+
+        unit_warnings = [c for c in self.mock_logger.warning.call_args_list if "Unsupported unit" in c.args[0]]
+        self.assertEqual(len(unit_warnings), 1)
+        self.assertEqual(snapshot.consumption.current_power, 800.0)
+
+    def test_unknown_entities_are_disabled(self):
+        """Test that entities unknown to Home Assistant are never fetched."""
+        self.home_assistant.get_entity_ids = Mock(return_value={"sensor.production", "sensor.consumption"})
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_production_entity("sensor.production", unit="kW")
+            .set_consumption_entity("sensor.consumption")
+            .set_grid_entity("sensor.grid_typo")
+            .build()
+        )
+
+        monitor.get_current_energy_state()
+        fetched = [c.args[0] for c in self.home_assistant.get_entity_state.call_args_list]
+
+        self.assertNotIn("sensor.grid_typo", fetched)
+        self.assertEqual(len(fetched), 2)
+
+    def test_unknown_entity_is_fetched_once_it_appears(self):
+        """Test that an entity missing at startup is checked again and fetched once Home Assistant knows it."""
+        self.entity_states["sensor.battery_remaining"] = ("5", "kWh")
+        known_entity_ids = {"sensor.consumption", "sensor.battery_soc", "sensor.battery_power"}
+        self.home_assistant.get_entity_ids = Mock(side_effect=lambda: set(known_entity_ids))
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .set_battery_entities("sensor.battery_soc", "sensor.battery_power")
+            .set_battery_remaining_capacity_entity("sensor.battery_remaining", unit="kWh")
+            .build()
+        )
+        snapshot = monitor.get_current_energy_state()
+        self.assertIsNone(snapshot.battery.remaining_capacity)
+
+        # The entity shows up, e.g. after its integration has been reloaded
+        known_entity_ids.add("sensor.battery_remaining")
+        for _ in range(UNKNOWN_ENTITIES_RECHECK_POLLS):
+            snapshot = monitor.get_current_energy_state()
+
+        self.assertEqual(self.home_assistant.get_entity_ids.call_count, 2)
+        self.assertEqual(snapshot.battery.remaining_capacity, 5000.0)
+
+    def test_missing_critical_value_returns_none(self):
+        """Test that a configured but unavailable consumption entity aborts the snapshot."""
+        del self.entity_states["sensor.consumption"]
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .build()
+        )
+
+        self.assertIsNone(monitor.get_current_energy_state())
+
+    def test_background_refresh_serves_cached_snapshot(self):
+        """Test that with background refresh the snapshot is served without fetching on demand."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .set_background_refresh(interval_seconds=60, max_data_age_seconds=120)
+            .build()
+        )
+        try:
+            snapshot = monitor.get_current_energy_state()
+            snapshot_again = monitor.get_current_energy_state()
+        finally:
+            monitor.stop()
+
+        self.assertIsNotNone(snapshot)
+        self.assertIs(snapshot, snapshot_again)
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 1)
+
+    def test_background_refresh_first_read_fetches_state(self):
+        """Test that the first read does not wait for the refresh thread, which is only started by it."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .set_background_refresh(interval_seconds=60, max_data_age_seconds=120)
+            .build()
+        )
+        self.assertIsNone(monitor._thread)
+
+        try:
+            snapshot = monitor.get_current_energy_state()
+            self.assertTrue(monitor._thread.is_alive())
+        finally:
+            monitor.stop()
+
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot.consumption.current_power, 800.0)
+        self.assertIsNone(monitor._thread)
+
+    def test_background_refresh_rejects_stale_snapshot(self):
+        """Test that a snapshot older than the maximum data age is not served."""
+        monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .build()
+        )
+        snapshot = monitor.get_current_energy_state()
+        object.__setattr__(snapshot, "timestamp", datetime.now() - timedelta(minutes=10))
+        monitor.refresh_interval_seconds = 60
+        monitor._snapshot = snapshot
+
+        self.assertIsNone(monitor.get_current_energy_state())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Unit tests for DummySolarForecastProvider adapter."""
+
+import unittest
+
+from edge_mining.adapters.domain.forecast.dummy_solar import DummySolarForecastProvider
+
+
+class TestDummySolarForecastProvider(unittest.TestCase):
+    """Test cases for DummySolarForecastProvider class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.provider = DummySolarForecastProvider(
+            capacity_kwp=5.0,
+            efficiency_percent=80.0,
+            production_start_hour=6,
+            production_end_hour=20,
+        )
+
+    def test_forecast_covers_next_24_hours(self):
+        """Test that the forecast contains one interval per hour."""
+        forecast = self.provider.get_forecast()
+
+        self.assertIsNotNone(forecast)
+        self.assertEqual(len(forecast.intervals), 24)
+        for interval in forecast.intervals:
+            self.assertEqual(len(interval.power_points), 1)
+
+    def test_power_only_inside_production_window(self):
+        """Test that power is produced only inside the production hours and never above capacity."""
+        forecast = self.provider.get_forecast()
+        base_max_watts = 5.0 * 1000 * 0.8
+
+        for interval in forecast.intervals:
+            point = interval.power_points[0]
+            if not 6 < point.timestamp.hour < 20:
+                self.assertEqual(point.power, 0.0)
+            self.assertGreaterEqual(point.power, 0.0)
+            self.assertLessEqual(point.power, base_max_watts)
+            self.assertEqual(interval.energy, point.power)
+
+    def test_forecast_reused_within_the_same_hour(self):
+        """Test that the forecast is generated once per hour and then reused."""
+        first = self.provider.get_forecast()
+        second = self.provider.get_forecast()
+
+        self.assertIs(first, second)
+
+        # Pretend the last forecast was generated in a previous hour
+        self.provider._cache_key = None
+        third = self.provider.get_forecast()
+
+        self.assertIsNot(first, third)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Unit tests for HomeAssistantForecastProvider adapter."""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from edge_mining.adapters.domain.forecast.home_assistant_api import HomeAssistantForecastProviderBuilder
+from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import ServiceHomeAssistantAPI
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class TestHomeAssistantForecastProvider(unittest.TestCase):
+    """Test cases for HomeAssistantForecastProvider class."""
+
+    def setUp(self):
+        """Set up a Home Assistant service that never touches the network."""
+        self.mock_logger = Mock(spec=LoggerPort)
+        with patch.object(ServiceHomeAssistantAPI, "connect"):
+            self.home_assistant = ServiceHomeAssistantAPI(
+                api_url="http://homeassistant.local:8123", token="token", logger=self.mock_logger
+            )
+        self.entity_states = {
+            "sensor.power_now": ("1.5", "kW"),
+            "sensor.power_next_hour": ("1200", "W"),
+            "sensor.energy_current_hour": ("1.2", "kWh"),
+            "sensor.energy_today": ("12.5", "kWh"),
+            "sensor.energy_tomorrow": ("9.0", "kWh"),
+        }
+        self.home_assistant.get_entity_state = Mock(
+            side_effect=lambda entity_id: self.entity_states.get(entity_id, (None, None))
+        )
+        self.home_assistant.get_entity_states = Mock(
+            side_effect=lambda entity_ids: {
+                entity_id: self.entity_states.get(entity_id, (None, None)) for entity_id in entity_ids
+            }
+        )
+
+    def _builder(self) -> HomeAssistantForecastProviderBuilder:
+        return (
+            HomeAssistantForecastProviderBuilder(home_assistant=self.home_assistant, logger=self.mock_logger)
+            .set_actual_power_entity("sensor.power_now", unit="kW")
+            .set_actual_energy_entity("sensor.energy_current_hour")
+        )
+
+    def test_only_configured_entities_are_fetched(self):
+        """Test that the configured entities are fetched with a single request and the others never."""
+        provider = (
+            self._builder()
+            .set_next_1h_power_entity("sensor.power_next_hour")
+            .set_today_energy_entity("sensor.energy_today")
+            .set_tomorrow_energy_entity("sensor.energy_tomorrow")
+            .build()
+        )
+
+        forecast = provider.get_forecast()
+
+        self.home_assistant.get_entity_states.assert_called_once()
+        self.home_assistant.get_entity_state.assert_not_called()
+        fetched = sorted(self.home_assistant.get_entity_states.call_args.args[0])
+        self.assertEqual(
+            fetched,
+            [
+                "sensor.energy_current_hour",
+                "sensor.energy_today",
+                "sensor.energy_tomorrow",
+                "sensor.power_next_hour",
+                "sensor.power_now",
+            ],
+        )
+        self.assertIsNotNone(forecast)
+        powers = sorted(point.power for interval in forecast.intervals for point in interval.power_points)
+        self.assertEqual(powers, [1200.0, 1500.0])
+        energies = sorted(interval.energy for interval in forecast.intervals if interval.energy is not None)
+        self.assertEqual(energies, [1200.0, 9000.0, 12500.0])
+
+    def test_entities_are_fetched_concurrently(self):
+        """Test that, when the states cannot be listed, the entity requests do not wait for each other."""
+        provider = self._builder().set_today_energy_entity("sensor.energy_today").build()
+        self.home_assistant.get_entity_states = Mock(return_value=None)
+
+        # Every request waits until all the three requests have started
+        barrier = threading.Barrier(3, timeout=5)
+
+        def get_entity_state(entity_id):
+            barrier.wait()
+            return self.entity_states[entity_id]
+
+        self.home_assistant.get_entity_state = Mock(side_effect=get_entity_state)
+
+        forecast = provider.get_forecast()
+
+        self.assertIsNotNone(forecast)
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 3)
+
+    def test_few_entities_are_fetched_one_by_one(self):
+        """Test that below the bulk threshold the states are not listed."""
+        provider = self._builder().build()
+
+        forecast = provider.get_forecast()
+
+        self.assertIsNotNone(forecast)
+        self.home_assistant.get_entity_states.assert_not_called()
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 2)
+
+    def test_missing_critical_value_returns_none(self):
+        """Test that a configured but unavailable energy for today prevents the forecast."""
+        provider = self._builder().set_today_energy_entity("sensor.missing").build()
+
+        self.assertIsNone(provider.get_forecast())
+
+    def test_unsupported_unit_is_reported_once(self):
+        """Test that an unsupported unit is reported at construction and not on every forecast."""
+        provider = (
+            self._builder().set_next_1h_power_entity("sensor.power_next_hour", unit="hp").set_cache_ttl(0).build()
+        )
+
+        provider.get_forecast()
+        forecast = provider.get_forecast()
+
+        unit_warnings = [c for c in self.mock_logger.warning.call_args_list if "Unsupported unit" in c.args[0]]
+        self.assertEqual(len(unit_warnings), 1)
+        powers = sorted(point.power for interval in forecast.intervals for point in interval.power_points)
+        self.assertEqual(powers, [1200.0, 1500.0])
+
+    def test_forecast_is_cached_within_ttl(self):
+        """Test that a fresh forecast is reused without fetching the entities again."""
+        provider = self._builder().set_cache_ttl(60).build()
+
+        first = provider.get_forecast()
+        second = provider.get_forecast()
+
+        self.assertIs(first, second)
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 2)
+
+    def test_cache_can_be_disabled(self):
+        """Test that with a zero TTL every call fetches the entities."""
+        provider = self._builder().set_cache_ttl(0).build()
+
+        provider.get_forecast()
+        provider.get_forecast()
+
+        self.assertEqual(self.home_assistant.get_entity_state.call_count, 4)
+
+    def test_stale_forecast_is_used_on_error(self):
+        """Test that the last forecast is returned when a new one cannot be built."""
+        provider = self._builder().set_today_energy_entity("sensor.energy_today").build()
+        first = provider.get_forecast()
+        self.assertIsNotNone(first)
+
+        # Expire the cached forecast and make a critical value unavailable
+        provider._cache = (datetime.now() - timedelta(minutes=5), first)
+        del self.entity_states["sensor.energy_today"]
+
+        self.assertIs(provider.get_forecast(), first)
+
+    def test_failed_refresh_is_not_retried_within_ttl(self):
+        """Test that after a failure the stale forecast is returned without fetching again until the TTL expires."""
+        provider = self._builder().set_today_energy_entity("sensor.energy_today").build()
+        first = provider.get_forecast()
+        provider._cache = (datetime.now() - timedelta(minutes=5), first)
+        del self.entity_states["sensor.energy_today"]
+        provider.get_forecast()
+        calls = self.home_assistant.get_entity_states.call_count
+
+        self.assertIs(provider.get_forecast(), first)
+        self.assertEqual(self.home_assistant.get_entity_states.call_count, calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unit tests for ServiceHomeAssistantAPI external service."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from edge_mining.adapters.infrastructure.homeassistant import homeassistant_api
+from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import ServiceHomeAssistantAPI
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class TestServiceHomeAssistantAPIStateCache(unittest.TestCase):
+    """Test cases for the entity state cache of ServiceHomeAssistantAPI."""
+
+    def setUp(self):
+        """Set up a Home Assistant service with a mocked client."""
+        with patch.object(ServiceHomeAssistantAPI, "connect"):
+            self.service = ServiceHomeAssistantAPI(
+                api_url="http://homeassistant.local:8123", token="token", logger=Mock(spec=LoggerPort)
+            )
+        entity = Mock()
+        entity.state.state = "1200"
+        entity.state.attributes = {"unit_of_measurement": "W"}
+        self.service.client = Mock()
+        self.service.client.get_entity.return_value = entity
+
+    def test_state_is_reused_within_ttl(self):
+        """Test that an entity requested twice in a short time is fetched once."""
+        self.assertEqual(self.service.get_entity_state("sensor.power"), ("1200", "W"))
+        self.assertEqual(self.service.get_entity_state("sensor.power"), ("1200", "W"))
+
+        self.service.client.get_entity.assert_called_once()
+
+    def test_expired_state_is_fetched_again(self):
+        """Test that a state older than the TTL is not reused."""
+        with patch.object(homeassistant_api.time, "monotonic", side_effect=[100.0, 200.0, 200.0]):
+            self.service.get_entity_state("sensor.power")
+            self.service.get_entity_state("sensor.power")
+
+        self.assertEqual(self.service.client.get_entity.call_count, 2)
+
+    def test_cache_can_be_disabled(self):
+        """Test that with a zero TTL every request fetches the entity."""
+        self.service.state_cache_ttl_seconds = 0
+
+        self.service.get_entity_state("sensor.power")
+        self.service.get_entity_state("sensor.power")
+
+        self.assertEqual(self.service.client.get_entity.call_count, 2)
+
+    def test_unavailable_state_is_not_cached(self):
+        """Test that an unavailable entity is fetched again on the next request."""
+        self.service.client.get_entity.return_value.state.state = "unavailable"
+
+        self.assertEqual(self.service.get_entity_state("sensor.power"), (None, None))
+        self.service.get_entity_state("sensor.power")
+
+        self.assertEqual(self.service.client.get_entity.call_count, 2)
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used states are discarded when the cache is full."""
+        with patch.object(homeassistant_api, "STATE_CACHE_MAX_SIZE", 2):
+            self.service.get_entity_state("sensor.a")
+            self.service.get_entity_state("sensor.b")
+            self.service.get_entity_state("sensor.c")
+
+        self.assertEqual(list(self.service._state_cache), ["sensor.b", "sensor.c"])
+
+
+class TestServiceHomeAssistantAPIConnection(unittest.TestCase):
+    """Test cases for the connection of ServiceHomeAssistantAPI."""
+
+    def test_client_uses_a_plain_session(self):
+        """Test that the client keeps one session alive and does not cache responses."""
+        with patch.object(homeassistant_api, "Client") as client_class:
+            service = ServiceHomeAssistantAPI(api_url="http://homeassistant.local:8123/", token="token", logger=None)
+
+        client_class.assert_called_once_with("http://homeassistant.local:8123/api", "token", cache_session=False)
+
+        service.disconnect()
+        client_class.return_value.cache_session.close.assert_called_once()
+        self.assertIsNone(service.client)
+
+
+if __name__ == "__main__":
+    unittest.main()
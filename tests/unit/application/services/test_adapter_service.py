@@ -0,0 +1,72 @@
+"""Unit tests for AdapterService."""
+
+import unittest
+import uuid
+from unittest.mock import Mock, patch
+
+from edge_mining.adapters.domain.energy.home_assistant_api import HomeAssistantAPIEnergyMonitorBuilder
+from edge_mining.adapters.infrastructure.homeassistant.homeassistant_api import ServiceHomeAssistantAPI
+from edge_mining.application.services.adapter_service import AdapterService
+from edge_mining.domain.common import EntityId
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class TestAdapterServiceCache(unittest.TestCase):
+    """Test cases for the adapter cache of AdapterService."""
+
+    def setUp(self):
+        """Set up an adapter service with a cached Home Assistant energy monitor refreshing in background."""
+        self.mock_logger = Mock(spec=LoggerPort)
+        self.adapter_service = AdapterService(
+            energy_monitor_repo=Mock(),
+            miner_controller_repo=Mock(),
+            notifier_repo=Mock(),
+            forecast_provider_repo=Mock(),
+            mining_performance_tracker_repo=Mock(),
+            home_forecast_provider_repo=Mock(),
+            external_service_repo=Mock(),
+            logger=self.mock_logger,
+        )
+
+        with patch.object(ServiceHomeAssistantAPI, "connect"):
+            home_assistant = ServiceHomeAssistantAPI(
+                api_url="http://homeassistant.local:8123", token="token", logger=self.mock_logger
+            )
+        home_assistant.get_entity_state = Mock(return_value=("800", "W"))
+
+        self.monitor = (
+            HomeAssistantAPIEnergyMonitorBuilder(home_assistant=home_assistant, logger=self.mock_logger)
+            .set_consumption_entity("sensor.consumption")
+            .set_background_refresh(interval_seconds=60, max_data_age_seconds=120)
+            .build()
+        )
+        self.monitor.get_current_energy_state()
+        self.thread = self.monitor._thread
+
+        self.monitor_id = EntityId(uuid.uuid4())
+        self.adapter_service._instance_cache[self.monitor_id] = self.monitor
+
+    def tearDown(self):
+        self.monitor.stop()
+
+    def test_remove_adapter_stops_background_refresh(self):
+        """Test that removing an adapter from the cache stops its refresh thread."""
+        self.assertTrue(self.thread.is_alive())
+
+        self.adapter_service.remove_adapter(self.monitor_id)
+
+        self.assertNotIn(self.monitor_id, self.adapter_service._instance_cache)
+        self.assertFalse(self.thread.is_alive())
+
+    def test_clear_all_adapters_stops_background_refresh(self):
+        """Test that clearing the cache stops the refresh threads and keeps adapters without one."""
+        self.adapter_service._instance_cache[EntityId(uuid.uuid4())] = None
+
+        self.adapter_service.clear_all_adapters()
+
+        self.assertEqual(self.adapter_service._instance_cache, {})
+        self.assertFalse(self.thread.is_alive())
+
+
+if __name__ == "__main__":
+    unittest.main()